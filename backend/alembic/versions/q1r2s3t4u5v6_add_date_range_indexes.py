@@ -0,0 +1,44 @@
+"""add date range indexes
+
+Composite-Indexes für Datumsbereichs-Queries:
+  - shifts (tenant_id, date) / (employee_id, date): existieren seit b3c4d5e6f7a8,
+    fehlen aber in DBs, die per create_tables() statt Alembic angelegt wurden
+  - employee_absences (employee_id, start_date, end_date): Überlappungs-Checks
+    und Abwesenheiten je Mitarbeiter im Zeitraum
+
+Revision ID: q1r2s3t4u5v6
+Revises: p0q1r2s3t4u5
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "q1r2s3t4u5v6"
+down_revision = "p0q1r2s3t4u5"
+branch_labels = None
+depends_on = None
+
+
+_INDEXES = [
+    ("ix_shifts_tenant_date", "shifts", ["tenant_id", "date"]),
+    ("ix_shifts_employee_date", "shifts", ["employee_id", "date"]),
+    ("ix_employee_absences_employee_dates", "employee_absences", ["employee_id", "start_date", "end_date"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    for name, table, columns in _INDEXES:
+        existing_indexes = {idx["name"] for idx in inspector.get_indexes(table)}
+        if name not in existing_indexes:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    # Nur den hier neu eingeführten Index entfernen – die Shift-Indexes gehören zu b3c4d5e6f7a8
+    inspector = sa.inspect(op.get_bind())
+    existing_indexes = {idx["name"] for idx in inspector.get_indexes("employee_absences")}
+    if "ix_employee_absences_employee_dates" in existing_indexes:
+        op.drop_index("ix_employee_absences_employee_dates", table_name="employee_absences")
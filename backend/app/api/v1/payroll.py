@@ -1,6 +1,7 @@
 """
 Payroll API – Lohnabrechnung
 """
+import asyncio
 import uuid
 from datetime import date
 
@@ -443,7 +444,10 @@ async def download_payroll_pdf(entry_id: uuid.UUID, current_user: CurrentUser, d
             detail=f"Kein gueltiger Vertrag fuer Mitarbeiter im Monat {entry.month}",
         )
 
-    pdf_bytes = generate_payslip_pdf(entry, employee, tenant_name, contract=active_contract)
+    # reportlab-Rendering ist reine CPU-Arbeit → nicht auf der Event-Loop ausführen
+    pdf_bytes = await asyncio.to_thread(
+        generate_payslip_pdf, entry, employee, tenant_name, contract=active_contract
+    )
 
     month_str = entry.month.strftime("%Y-%m")
     filename = f"vera-abrechnung-{employee.last_name.lower()}-{month_str}.pdf"
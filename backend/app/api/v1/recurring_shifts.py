@@ -14,7 +14,7 @@ from app.schemas.recurring_shift import (
     RecurringShiftPreview, RecurringShiftOut, RecurringShiftCreateResponse, PreviewResponse,
 )
 from app.services.recurring_shift_service import (
-    generate_shifts, delete_future_planned_shifts, preview_generate,
+    insert_generated_shifts, delete_future_planned_shifts, preview_generate,
 )
 
 router = APIRouter(prefix="/recurring-shifts", tags=["recurring-shifts"])
@@ -74,22 +74,20 @@ async def create_recurring_shift(data: RecurringShiftCreate, current_user: Manag
     db.add(rs)
     await db.flush()  # get rs.id
 
-    new_shifts, skipped = await generate_shifts(
+    generated, skipped = await insert_generated_shifts(
         rs=rs,
         from_date=data.valid_from,
         until_date=data.valid_until,
         profile=profile,
         db=db,
     )
-    for s in new_shifts:
-        db.add(s)
 
     await db.commit()
     await db.refresh(rs)
 
     return RecurringShiftCreateResponse(
         recurring_shift=RecurringShiftOut.from_orm_with_weekday(rs),
-        generated_count=len(new_shifts),
+        generated_count=generated,
         skipped_count=skipped,
     )
 
@@ -128,22 +126,20 @@ async def update_from(rs_id: uuid.UUID, data: RecurringShiftUpdateFrom, current_
     profile = await _load_profile(rs.holiday_profile_id, current_user.tenant_id, db)
 
     # Regenerate from from_date to valid_until
-    new_shifts, skipped = await generate_shifts(
+    generated, skipped = await insert_generated_shifts(
         rs=rs,
         from_date=data.from_date,
         until_date=rs.valid_until,
         profile=profile,
         db=db,
     )
-    for s in new_shifts:
-        db.add(s)
 
     await db.commit()
     await db.refresh(rs)
 
     return RecurringShiftCreateResponse(
         recurring_shift=RecurringShiftOut.from_orm_with_weekday(rs),
-        generated_count=len(new_shifts),
+        generated_count=generated,
         skipped_count=skipped,
     )
 
@@ -184,35 +180,28 @@ async def _load_profile(
     tenant_id,
     db,
 ) -> HolidayProfile | None:
+    # Beziehungen gleich mitladen (selectin) – ein Profil-SELECT statt zwei
+    stmt = select(HolidayProfile).options(
+        selectinload(HolidayProfile.vacation_periods),
+        selectinload(HolidayProfile.custom_holidays),
+    )
     if profile_id is None:
         # Try to use tenant's active profile
         result = await db.execute(
-            select(HolidayProfile).where(
+            stmt.where(
                 HolidayProfile.tenant_id == tenant_id,
                 HolidayProfile.is_active == True,
             )
         )
-        profile = result.scalar_one_or_none()
-        if profile is None:
-            return None
-    else:
-        result = await db.execute(
-            select(HolidayProfile).where(
-                HolidayProfile.id == profile_id,
-                HolidayProfile.tenant_id == tenant_id,
-            )
-        )
-        profile = result.scalar_one_or_none()
-        if not profile:
-            raise HTTPException(status_code=404, detail="Ferienprofil nicht gefunden")
-
-    # Load relationships eagerly
-    result2 = await db.execute(
-        select(HolidayProfile)
-        .options(
-            selectinload(HolidayProfile.vacation_periods),
-            selectinload(HolidayProfile.custom_holidays),
+        return result.scalar_one_or_none()
+
+    result = await db.execute(
+        stmt.where(
+            HolidayProfile.id == profile_id,
+            HolidayProfile.tenant_id == tenant_id,
         )
-        .where(HolidayProfile.id == profile.id)
     )
-    return result2.scalar_one()
+    profile = result.scalar_one_or_none()
+    if not profile:
+        raise HTTPException(status_code=404, detail="Ferienprofil nicht gefunden")
+    return profile
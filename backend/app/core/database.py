@@ -21,8 +21,8 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
-# Separate NullPool-Engine für Celery-Tasks: jeder Task-Aufruf startet mit
-# asyncio.run() eine eigene, frische Event-Loop, aber asyncpg-Connections sind
+# Separate NullPool-Engine für Celery-Tasks: Tasks laufen über run_async() auf
+# einer Loop pro Worker-Thread (nicht der der API), aber asyncpg-Connections sind
 # an die Loop gebunden, in der sie erzeugt wurden. Eine aus dem normalen Pool
 # wiederverwendete Connection einer anderen Loop wirft "attached to a
 # different loop". NullPool öffnet pro Checkout eine neue Connection und
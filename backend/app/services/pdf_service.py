@@ -5,6 +5,7 @@ Gibt bytes zurück – kein Dateisystem-Storage nötig.
 from __future__ import annotations
 
 import io
+import operator
 from datetime import date, datetime, timezone
 from typing import TYPE_CHECKING
 
@@ -12,7 +13,8 @@ from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import cm
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, HRFlowable
+from reportlab.pdfgen import canvas
+from reportlab.platypus import Frame, Table, TableStyle, Paragraph, Spacer, HRFlowable
 
 from app.core.constants import MINIJOB_ANNUAL_LIMIT_CURRENT
 
@@ -62,6 +64,15 @@ SURCHARGE_LABELS = {
 }
 
 
+# (Getter, Label-Key) für Zuschlagsstunden bzw. -beträge – einmalig vorberechnet
+_SURCHARGE_HOUR_SPECS = [
+    (operator.attrgetter(f"{key}_hours"), key) for key in SURCHARGE_LABELS
+]
+_SURCHARGE_AMOUNT_SPECS = [
+    (operator.attrgetter(f"{key}_surcharge"), key) for key in SURCHARGE_LABELS
+]
+
+
 def _fmt_euro(val: float | None) -> str:
     if val is None:
         return "–"
@@ -78,32 +89,58 @@ def _tbl_style(base: list) -> TableStyle:
     return TableStyle(base)
 
 
-# ── Haupt-Funktion ────────────────────────────────────────────────────────────
-
-def generate_payslip_pdf(
-    entry: "PayrollEntry",
-    employee: "Employee",
-    tenant_name: str,
-    contract: "ContractHistory | None" = None,
-) -> bytes:
-    """Erstellt einen Lohnzettel als PDF und gibt die Bytes zurück."""
-
-    if contract is None:
-        raise ValueError(
-            f"generate_payslip_pdf requires a ContractHistory row for employee {employee.id}. "
-            "Caller must query ContractHistory and pass it explicitly."
-        )
-
-    buf = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buf,
-        pagesize=A4,
-        leftMargin=2 * cm,
-        rightMargin=2 * cm,
-        topMargin=2 * cm,
-        bottomMargin=2 * cm,
-    )
+# Gemeinsame Befehle der Stunden-, Vergütungs- und Minijob-Tabelle
+_BODY_TABLE_CMDS = [
+    ("FONTSIZE",      (0, 0), (-1, -1), 9),
+    ("TOPPADDING",    (0, 0), (-1, -1), 4),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ("LEFTPADDING",   (0, 0), (-1, -1), 6),
+    ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
+    ("GRID",          (0, 0), (-1, -1), 0.25, colors.HexColor("#E5E7EB")),
+]
 
+# Statische Tabellen-Styles: einmal gebaut, für jeden Lohnzettel wiederverwendet
+_HEADER_STYLE = _tbl_style([
+    ("BACKGROUND",  (0, 0), (-1, -1), _NAVY),
+    ("TEXTCOLOR",   (0, 0), (-1, -1), _WHITE),
+    ("FONTNAME",    (0, 0), (0, 0),   "Helvetica-Bold"),
+    ("FONTSIZE",    (0, 0), (-1, -1), 11),
+    ("ALIGN",       (1, 0), (1, 0),   "RIGHT"),
+    ("TOPPADDING",  (0, 0), (-1, -1), 8),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+    ("LEFTPADDING", (0, 0), (-1, -1), 10),
+    ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+])
+
+_INFO_STYLE = _tbl_style([
+    ("FONTNAME",    (0, 0), (0, -1), "Helvetica-Bold"),
+    ("FONTNAME",    (2, 0), (2, -1), "Helvetica-Bold"),
+    ("FONTSIZE",    (0, 0), (-1, -1), 9),
+    ("TOPPADDING",  (0, 0), (-1, -1), 3),
+    ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
+    ("LEFTPADDING", (0, 0), (-1, -1), 4),
+    ("BACKGROUND",  (0, 0), (-1, -1), _LIGHT),
+    ("ROWBACKGROUNDS", (0, 0), (-1, -1), [_WHITE, _LIGHT, _WHITE]),
+])
+
+_HOURS_STYLE = _tbl_style([
+    *_BODY_TABLE_CMDS,
+    ("BACKGROUND",    (0, 0), (-1, 0),  _NAVY),
+    ("TEXTCOLOR",     (0, 0), (-1, 0),  _WHITE),
+    ("FONTNAME",      (0, 0), (-1, 0),  "Helvetica-Bold"),
+    ("FONTNAME",      (0, 1), (0, -1),  "Helvetica"),
+    ("ALIGN",         (1, 0), (1, -1),  "RIGHT"),
+    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [_WHITE, _LIGHT]),
+])
+
+
+# ── Bausteine ─────────────────────────────────────────────────────────────────
+
+_MARGIN = 2 * cm
+_PAGE_W = A4[0] - 2 * _MARGIN  # nutzbare Breite
+
+
+def _styles():
     styles = getSampleStyleSheet()
     normal = styles["Normal"]
     normal.fontName = "Helvetica"
@@ -124,64 +161,247 @@ def generate_payslip_pdf(
         fontSize=8,
         textColor=_GRAY,
     )
+    return normal, heading, small_gray
 
-    month_label = f"{MONTH_NAMES[entry.month.month]} {entry.month.year}"
-    emp_name = f"{employee.first_name} {employee.last_name}"
-    contract_label = CONTRACT_LABELS.get(contract.contract_type, contract.contract_type or "–")
 
-    story = []
-    page_w = A4[0] - 4 * cm  # nutzbare Breite
+def _header_and_info(
+    story: list,
+    normal: ParagraphStyle,
+    tenant_name: str,
+    emp_name: str,
+    month_label: str,
+    contract_label: str,
+    hourly_rate: float,
+    status_label: str,
+) -> None:
+    page_w = _PAGE_W
 
     # ── Header ────────────────────────────────────────────────────────────────
     header_data = [[
-        Paragraph("<font color='white'><b>VERA – Lohnabrechnung</b></font>", styles["Normal"]),
-        Paragraph(f"<font color='white'>{tenant_name}</font>", styles["Normal"]),
+        Paragraph("<font color='white'><b>VERA – Lohnabrechnung</b></font>", normal),
+        Paragraph(f"<font color='white'>{tenant_name}</font>", normal),
     ]]
     header_tbl = Table(header_data, colWidths=[page_w * 0.6, page_w * 0.4])
-    header_tbl.setStyle(_tbl_style([
-        ("BACKGROUND",  (0, 0), (-1, -1), _NAVY),
-        ("TEXTCOLOR",   (0, 0), (-1, -1), _WHITE),
-        ("FONTNAME",    (0, 0), (0, 0),   "Helvetica-Bold"),
-        ("FONTSIZE",    (0, 0), (-1, -1), 11),
-        ("ALIGN",       (1, 0), (1, 0),   "RIGHT"),
-        ("TOPPADDING",  (0, 0), (-1, -1), 8),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-        ("LEFTPADDING", (0, 0), (-1, -1), 10),
-        ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-    ]))
+    header_tbl.setStyle(_HEADER_STYLE)
     story.append(header_tbl)
     story.append(Spacer(1, 0.4 * cm))
 
     # ── Mitarbeiter + Monat ───────────────────────────────────────────────────
     info_data = [
-        [Paragraph("<b>Mitarbeiter</b>", styles["Normal"]),
-         Paragraph(emp_name, styles["Normal"]),
-         Paragraph("<b>Monat</b>", styles["Normal"]),
-         Paragraph(month_label, styles["Normal"])],
-        [Paragraph("<b>Vertragsart</b>", styles["Normal"]),
-         Paragraph(contract_label, styles["Normal"]),
-         Paragraph("<b>Stundenlohn</b>", styles["Normal"]),
-         Paragraph(_fmt_euro(float(contract.hourly_rate)), styles["Normal"])],
-        [Paragraph("<b>Status</b>", styles["Normal"]),
-         Paragraph(STATUS_LABELS.get(entry.status, entry.status), styles["Normal"]),
-         Paragraph("", styles["Normal"]),
-         Paragraph("", styles["Normal"])],
+        [Paragraph("<b>Mitarbeiter</b>", normal),
+         Paragraph(emp_name, normal),
+         Paragraph("<b>Monat</b>", normal),
+         Paragraph(month_label, normal)],
+        [Paragraph("<b>Vertragsart</b>", normal),
+         Paragraph(contract_label, normal),
+         Paragraph("<b>Stundenlohn</b>", normal),
+         Paragraph(_fmt_euro(hourly_rate), normal)],
+        [Paragraph("<b>Status</b>", normal),
+         Paragraph(status_label, normal),
+         Paragraph("", normal),
+         Paragraph("", normal)],
     ]
     col_w = page_w / 4
     info_tbl = Table(info_data, colWidths=[col_w * 0.7, col_w * 1.3, col_w * 0.7, col_w * 1.3])
-    info_tbl.setStyle(_tbl_style([
-        ("FONTNAME",    (0, 0), (0, -1), "Helvetica-Bold"),
-        ("FONTNAME",    (2, 0), (2, -1), "Helvetica-Bold"),
-        ("FONTSIZE",    (0, 0), (-1, -1), 9),
-        ("TOPPADDING",  (0, 0), (-1, -1), 3),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 3),
-        ("LEFTPADDING", (0, 0), (-1, -1), 4),
-        ("BACKGROUND",  (0, 0), (-1, -1), _LIGHT),
-        ("ROWBACKGROUNDS", (0, 0), (-1, -1), [_WHITE, _LIGHT, _WHITE]),
-    ]))
+    info_tbl.setStyle(_INFO_STYLE)
     story.append(info_tbl)
     story.append(Spacer(1, 0.4 * cm))
 
+
+def _minijob_block(
+    story: list,
+    normal: ParagraphStyle,
+    heading: ParagraphStyle,
+    ytd: float,
+    limit: float,
+    remaining: float,
+) -> None:
+    page_w = _PAGE_W
+    story.append(Spacer(1, 0.4 * cm))
+    story.append(Paragraph("Minijob-Jahresgrenze", heading))
+
+    pct = min(ytd / limit * 100, 100) if limit > 0 else 0
+
+    if pct >= 95:
+        warn_color = _RED
+        warn_text = "⚠ Jahresgrenze nahezu ausgeschöpft!"
+    elif pct >= 80:
+        warn_color = _AMBER
+        warn_text = "Jahresgrenze zu 80 % erreicht"
+    else:
+        warn_color = _GREEN
+        warn_text = ""
+
+    mj_rows = [
+        ["YTD-Brutto (kumuliert)", _fmt_euro(ytd)],
+        ["Jahresgrenze 2025",      _fmt_euro(limit)],
+        ["Verbleibend",            _fmt_euro(remaining)],
+        ["Ausschöpfung",           f"{pct:.1f} %"],
+    ]
+    mj_tbl = Table(mj_rows, colWidths=[page_w * 0.7, page_w * 0.3])
+    mj_style_list = [
+        *_BODY_TABLE_CMDS,
+        ("FONTNAME",      (0, 0), (0, -1),  "Helvetica-Bold"),
+        ("ALIGN",         (1, 0), (1, -1),  "RIGHT"),
+        ("ROWBACKGROUNDS", (0, 0), (-1, -1), [_WHITE, _LIGHT]),
+    ]
+    if pct >= 80:
+        mj_style_list.append(("TEXTCOLOR", (1, 2), (1, 2), warn_color))
+        mj_style_list.append(("TEXTCOLOR", (1, 3), (1, 3), warn_color))
+    mj_tbl.setStyle(_tbl_style(mj_style_list))
+    story.append(mj_tbl)
+
+    if warn_text:
+        story.append(Spacer(1, 0.15 * cm))
+        story.append(Paragraph(warn_text, ParagraphStyle(
+            "warn", parent=normal, fontSize=8, textColor=warn_color, fontName="Helvetica-Bold"
+        )))
+
+
+def _notes_and_footer(
+    story: list,
+    normal: ParagraphStyle,
+    heading: ParagraphStyle,
+    small_gray: ParagraphStyle,
+    notes: str | None,
+    created: str,
+    status_label: str,
+) -> None:
+    # ── Notizen ───────────────────────────────────────────────────────────────
+    if notes:
+        story.append(Spacer(1, 0.4 * cm))
+        story.append(Paragraph("Notizen", heading))
+        story.append(Paragraph(notes, normal))
+
+    # ── Footer ────────────────────────────────────────────────────────────────
+    story.append(Spacer(1, 0.5 * cm))
+    story.append(HRFlowable(width="100%", thickness=0.5, color=_GRAY))
+    story.append(Spacer(1, 0.15 * cm))
+    story.append(Paragraph(
+        f"Erstellt am {created} · VERA Schichtplanner · Status: {status_label}",
+        small_gray,
+    ))
+
+
+def _build(story: list) -> bytes:
+    """
+    Zeichnet die Flowables direkt über einen Frame auf ein Canvas.
+    Ein Lohnzettel passt praktisch immer auf eine Seite – der Mehrfach-Durchlauf
+    von SimpleDocTemplate (Page-Templates, Callbacks, Multi-Build) ist unnötig.
+    Läuft der Inhalt doch über, geht es auf einer neuen Seite weiter; Flowables,
+    die nicht mehr passen (z.B. lange Notizen), werden wie bei SimpleDocTemplate geteilt.
+    """
+    buf = io.BytesIO()
+    c = canvas.Canvas(buf, pagesize=A4)
+    while story:
+        frame = Frame(_MARGIN, _MARGIN, _PAGE_W, A4[1] - 2 * _MARGIN)
+        placed = 0
+        while story:
+            if frame.add(story[0], c):
+                story.pop(0)
+                placed += 1
+                continue
+            # Passt nicht mehr → in den Rest der Seite teilen; erster Teil passt, der Rest folgt
+            parts = frame.split(story[0], c)
+            if len(parts) < 2 or not frame.add(parts[0], c):
+                break
+            story[0:1] = parts[1:]
+            placed += 1
+        c.showPage()
+        if not placed:
+            raise ValueError("Payslip content does not fit on an empty page")
+    c.save()
+    return buf.getvalue()
+
+
+def _is_empty_month(entry: "PayrollEntry") -> bool:
+    """True, wenn die Stunden-/Vergütungstabellen nichts zeigen würden (alle Werte leer/0)."""
+    values = [
+        entry.planned_hours, entry.actual_hours, entry.carryover_hours, entry.paid_hours,
+        entry.base_wage, entry.total_gross,
+    ]
+    values += [getter(entry) for getter, _ in _SURCHARGE_HOUR_SPECS + _SURCHARGE_AMOUNT_SPECS]
+    return not any(values)
+
+
+def _render_empty_payslip(
+    tenant_name: str,
+    emp_name: str,
+    month_label: str,
+    contract_label: str,
+    hourly_rate: float,
+    status_label: str,
+    minijob: tuple[float, float, float] | None,
+    notes: str | None,
+    created: str,
+) -> bytes:
+    """
+    Lohnzettel für Monate ohne Tätigkeit: nur Kopf, Hinweis, ggf. Minijob-Block.
+    """
+    normal, heading, small_gray = _styles()
+    story: list = []
+    _header_and_info(
+        story, normal, tenant_name, emp_name, month_label,
+        contract_label, hourly_rate, status_label,
+    )
+    story.append(Paragraph("Vergütung", heading))
+    story.append(Paragraph(
+        "Keine Tätigkeit im Abrechnungsmonat – es fallen keine Stunden und keine Vergütung an.",
+        normal,
+    ))
+    if minijob is not None:
+        _minijob_block(story, normal, heading, *minijob)
+    _notes_and_footer(story, normal, heading, small_gray, notes, created, status_label)
+    return _build(story)
+
+
+# ── Haupt-Funktion ────────────────────────────────────────────────────────────
+
+def generate_payslip_pdf(
+    entry: "PayrollEntry",
+    employee: "Employee",
+    tenant_name: str,
+    contract: "ContractHistory | None" = None,
+) -> bytes:
+    """Erstellt einen Lohnzettel als PDF und gibt die Bytes zurück."""
+
+    if contract is None:
+        raise ValueError(
+            f"generate_payslip_pdf requires a ContractHistory row for employee {employee.id}. "
+            "Caller must query ContractHistory and pass it explicitly."
+        )
+
+    month_label = f"{MONTH_NAMES[entry.month.month]} {entry.month.year}"
+    emp_name = f"{employee.first_name} {employee.last_name}"
+    contract_label = CONTRACT_LABELS.get(contract.contract_type, contract.contract_type or "–")
+    hourly_rate = float(contract.hourly_rate)
+    status_label = STATUS_LABELS.get(entry.status, entry.status)
+    created = datetime.now(timezone.utc).strftime("%d.%m.%Y")
+
+    minijob = None
+    if contract.contract_type == "minijob":
+        minijob = (
+            float(entry.ytd_gross or 0),
+            float(contract.annual_salary_limit or MINIJOB_ANNUAL_LIMIT_CURRENT),
+            float(entry.annual_limit_remaining or 0),
+        )
+
+    # Fast-Path: keine Stunden (auch kein Soll/Übertrag), keine Vergütung → kompakter Lohnzettel
+    if _is_empty_month(entry):
+        return _render_empty_payslip(
+            tenant_name, emp_name, month_label, contract_label,
+            hourly_rate, status_label, minijob, entry.notes, created,
+        )
+
+    normal, heading, small_gray = _styles()
+    story: list = []
+    page_w = _PAGE_W
+
+    _header_and_info(
+        story, normal, tenant_name, emp_name, month_label,
+        contract_label, hourly_rate, status_label,
+    )
+
     # ── Stunden-Tabelle ───────────────────────────────────────────────────────
     story.append(Paragraph("Stunden", heading))
 
@@ -193,34 +413,13 @@ def generate_payslip_pdf(
         ["Bezahlt",    _fmt_hours(float(entry.paid_hours) if entry.paid_hours else None)],
     ]
 
-    surcharge_fields = [
-        ("early_hours",   "early"),
-        ("late_hours",    "late"),
-        ("night_hours",   "night"),
-        ("weekend_hours", "weekend"),
-        ("sunday_hours",  "sunday"),
-        ("holiday_hours", "holiday"),
-    ]
-    for field, key in surcharge_fields:
-        val = float(getattr(entry, field, 0) or 0)
-        if val > 0:
-            hours_rows.append([SURCHARGE_LABELS[key], _fmt_hours(val)])
+    for getter, key in _SURCHARGE_HOUR_SPECS:
+        val = getter(entry)
+        if val and float(val) > 0:
+            hours_rows.append([SURCHARGE_LABELS[key], _fmt_hours(float(val))])
 
     hours_tbl = Table(hours_rows, colWidths=[page_w * 0.7, page_w * 0.3])
-    hours_tbl.setStyle(_tbl_style([
-        ("BACKGROUND",    (0, 0), (-1, 0),  _NAVY),
-        ("TEXTCOLOR",     (0, 0), (-1, 0),  _WHITE),
-        ("FONTNAME",      (0, 0), (-1, 0),  "Helvetica-Bold"),
-        ("FONTNAME",      (0, 1), (0, -1),  "Helvetica"),
-        ("FONTSIZE",      (0, 0), (-1, -1), 9),
-        ("ALIGN",         (1, 0), (1, -1),  "RIGHT"),
-        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [_WHITE, _LIGHT]),
-        ("TOPPADDING",    (0, 0), (-1, -1), 4),
-        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-        ("LEFTPADDING",   (0, 0), (-1, -1), 6),
-        ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
-        ("GRID",          (0, 0), (-1, -1), 0.25, colors.HexColor("#E5E7EB")),
-    ]))
+    hours_tbl.setStyle(_HOURS_STYLE)
     story.append(hours_tbl)
     story.append(Spacer(1, 0.4 * cm))
 
@@ -233,18 +432,10 @@ def generate_payslip_pdf(
     if base > 0:
         wage_rows.append(["Grundlohn", _fmt_euro(base)])
 
-    surcharge_amount_fields = [
-        ("early_surcharge",   "early"),
-        ("late_surcharge",    "late"),
-        ("night_surcharge",   "night"),
-        ("weekend_surcharge", "weekend"),
-        ("sunday_surcharge",  "sunday"),
-        ("holiday_surcharge", "holiday"),
-    ]
-    for field, key in surcharge_amount_fields:
-        val = float(getattr(entry, field, 0) or 0)
-        if val > 0:
-            wage_rows.append([SURCHARGE_LABELS[key], _fmt_euro(val)])
+    for getter, key in _SURCHARGE_AMOUNT_SPECS:
+        val = getter(entry)
+        if val and float(val) > 0:
+            wage_rows.append([SURCHARGE_LABELS[key], _fmt_euro(float(val))])
 
     # Brutto-Summe fett + hervorgehoben
     wage_rows.append(["Brutto gesamt", _fmt_euro(float(entry.total_gross or 0))])
@@ -252,89 +443,22 @@ def generate_payslip_pdf(
 
     wage_tbl = Table(wage_rows, colWidths=[page_w * 0.7, page_w * 0.3])
     wage_style = [
+        *_BODY_TABLE_CMDS,
         ("BACKGROUND",    (0, 0),              (-1, 0),              _NAVY),
         ("TEXTCOLOR",     (0, 0),              (-1, 0),              _WHITE),
         ("FONTNAME",      (0, 0),              (-1, 0),              "Helvetica-Bold"),
-        ("FONTSIZE",      (0, 0),              (-1, -1),             9),
         ("ALIGN",         (1, 0),              (1, -1),              "RIGHT"),
         ("ROWBACKGROUNDS", (0, 1),             (-1, gross_row_idx - 1), [_WHITE, _LIGHT]),
         ("BACKGROUND",    (0, gross_row_idx),  (-1, gross_row_idx),  _LIGHT),
         ("FONTNAME",      (0, gross_row_idx),  (-1, gross_row_idx),  "Helvetica-Bold"),
-        ("TOPPADDING",    (0, 0),              (-1, -1),             4),
-        ("BOTTOMPADDING", (0, 0),              (-1, -1),             4),
-        ("LEFTPADDING",   (0, 0),              (-1, -1),             6),
-        ("RIGHTPADDING",  (0, 0),              (-1, -1),             6),
-        ("GRID",          (0, 0),              (-1, -1),             0.25, colors.HexColor("#E5E7EB")),
         ("LINEABOVE",     (0, gross_row_idx),  (-1, gross_row_idx),  0.5, _NAVY),
     ]
     wage_tbl.setStyle(_tbl_style(wage_style))
     story.append(wage_tbl)
 
     # ── Minijob-Block ─────────────────────────────────────────────────────────
-    if contract.contract_type == "minijob":
-        story.append(Spacer(1, 0.4 * cm))
-        story.append(Paragraph("Minijob-Jahresgrenze", heading))
-
-        ytd = float(entry.ytd_gross or 0)
-        limit = float(contract.annual_salary_limit or MINIJOB_ANNUAL_LIMIT_CURRENT)
-        remaining = float(entry.annual_limit_remaining or 0)
-        pct = min(ytd / limit * 100, 100) if limit > 0 else 0
-
-        if pct >= 95:
-            warn_color = _RED
-            warn_text = "⚠ Jahresgrenze nahezu ausgeschöpft!"
-        elif pct >= 80:
-            warn_color = _AMBER
-            warn_text = "Jahresgrenze zu 80 % erreicht"
-        else:
-            warn_color = _GREEN
-            warn_text = ""
-
-        mj_rows = [
-            ["YTD-Brutto (kumuliert)", _fmt_euro(ytd)],
-            ["Jahresgrenze 2025",      _fmt_euro(limit)],
-            ["Verbleibend",            _fmt_euro(remaining)],
-            ["Ausschöpfung",           f"{pct:.1f} %"],
-        ]
-        mj_tbl = Table(mj_rows, colWidths=[page_w * 0.7, page_w * 0.3])
-        mj_style_list = [
-            ("FONTSIZE",      (0, 0), (-1, -1), 9),
-            ("FONTNAME",      (0, 0), (0, -1),  "Helvetica-Bold"),
-            ("ALIGN",         (1, 0), (1, -1),  "RIGHT"),
-            ("ROWBACKGROUNDS", (0, 0), (-1, -1), [_WHITE, _LIGHT]),
-            ("TOPPADDING",    (0, 0), (-1, -1), 4),
-            ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ("LEFTPADDING",   (0, 0), (-1, -1), 6),
-            ("RIGHTPADDING",  (0, 0), (-1, -1), 6),
-            ("GRID",          (0, 0), (-1, -1), 0.25, colors.HexColor("#E5E7EB")),
-        ]
-        if pct >= 80:
-            mj_style_list.append(("TEXTCOLOR", (1, 2), (1, 2), warn_color))
-            mj_style_list.append(("TEXTCOLOR", (1, 3), (1, 3), warn_color))
-        mj_tbl.setStyle(_tbl_style(mj_style_list))
-        story.append(mj_tbl)
-
-        if warn_text:
-            story.append(Spacer(1, 0.15 * cm))
-            story.append(Paragraph(warn_text, ParagraphStyle(
-                "warn", parent=normal, fontSize=8, textColor=warn_color, fontName="Helvetica-Bold"
-            )))
+    if minijob is not None:
+        _minijob_block(story, normal, heading, *minijob)
 
-    # ── Notizen ───────────────────────────────────────────────────────────────
-    if entry.notes:
-        story.append(Spacer(1, 0.4 * cm))
-        story.append(Paragraph("Notizen", heading))
-        story.append(Paragraph(entry.notes, normal))
-
-    # ── Footer ────────────────────────────────────────────────────────────────
-    story.append(Spacer(1, 0.5 * cm))
-    story.append(HRFlowable(width="100%", thickness=0.5, color=_GRAY))
-    story.append(Spacer(1, 0.15 * cm))
-    now = datetime.now(timezone.utc).strftime("%d.%m.%Y")
-    story.append(Paragraph(
-        f"Erstellt am {now} · VERA Schichtplanner · Status: {STATUS_LABELS.get(entry.status, entry.status)}",
-        small_gray,
-    ))
-
-    doc.build(story)
-    return buf.getvalue()
+    _notes_and_footer(story, normal, heading, small_gray, entry.notes, created, status_label)
+    return _build(story)
@@ -3,98 +3,144 @@ Service for generating individual Shift records from a RecurringShift definition
 """
 from __future__ import annotations
 
+from bisect import bisect_right
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import select, and_
+from sqlalchemy import and_, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.shift import Shift
-from app.utils.german_holidays import get_bw_holidays
+from app.utils.german_holidays import get_bw_holiday_dates
 
 if TYPE_CHECKING:
     from app.models.holiday_profile import HolidayProfile
     from app.models.recurring_shift import RecurringShift
 
 
-def build_skip_set(
-    profile: "HolidayProfile | None",
-    skip_public_holidays: bool = True,
-    years: set[int] | None = None,
-) -> set[date]:
+class SkipDates:
     """
-    Build the set of dates to skip when generating shifts:
+    The dates to skip when generating shifts (`d in skip`):
       - All dates inside VacationPeriods
       - All CustomHoliday dates
       - All public holidays in BW (if skip_public_holidays=True)
-    """
-    skip: set[date] = set()
-
-    if profile is not None:
-        # Vacation periods
-        for period in profile.vacation_periods:
-            d = period.start_date
-            while d <= period.end_date:
-                skip.add(d)
-                d += timedelta(days=1)
 
-        # Custom holidays (bewegliche Ferientage)
-        for ch in profile.custom_holidays:
-            skip.add(ch.date)
+    Vacation periods are kept as merged, sorted (start, end) ordinal ranges and
+    checked via bisect, so memory grows with the number of periods rather than
+    the number of days off. Single days (custom + public holidays) are kept as a
+    frozenset of ordinals.
+    """
 
-    # Public holidays
-    if skip_public_holidays:
-        for year in (years or set()):
-            skip.update(get_bw_holidays(year).keys())
+    __slots__ = ("_starts", "_ends", "_days")
+
+    def __init__(
+        self,
+        profile: "HolidayProfile | None",
+        skip_public_holidays: bool = True,
+        years: set[int] | None = None,
+    ):
+        merged: list[list[int]] = []
+        days: set[int] = set()
+
+        if profile is not None:
+            ranges = sorted(
+                (p.start_date.toordinal(), p.end_date.toordinal())
+                for p in profile.vacation_periods
+            )
+            for start, end in ranges:
+                if merged and start <= merged[-1][1] + 1:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            days.update(ch.date.toordinal() for ch in profile.custom_holidays)
+
+        if skip_public_holidays:
+            for year in (years or set()):
+                days.update(d.toordinal() for d in get_bw_holiday_dates(year))
+
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+        self._days = frozenset(days)
+
+    def __contains__(self, d: date) -> bool:
+        o = d.toordinal()
+        if o in self._days:
+            return True
+        i = bisect_right(self._starts, o) - 1
+        return i >= 0 and o <= self._ends[i]
+
+
+def iter_weekday_dates(weekday: int, from_date: date, until_date: date):
+    """Yield every date in [from_date, until_date] that falls on the given weekday (0=Mo)."""
+    first = from_date + timedelta(days=(weekday - from_date.weekday()) % 7)
+    if first > until_date:
+        return
+    for i in range((until_date - first).days // 7 + 1):
+        yield first + timedelta(days=7 * i)
+
+
+def build_shift_rows(
+    rs: "RecurringShift",
+    from_date: date,
+    until_date: date,
+    profile: "HolidayProfile | None",
+) -> tuple[list[dict], int]:
+    """
+    Column values for every matching weekday in [from_date, until_date]
+    that is not in the skip set. Returns (rows, skipped_count).
+    """
+    years = set(range(from_date.year, until_date.year + 1))
+    skip = SkipDates(profile, rs.skip_public_holidays, years)
 
-    return skip
+    # Constant for all generated dates since they share rs.weekday
+    is_weekend = rs.weekday >= 5
+    is_sunday = rs.weekday == 6
 
+    rows: list[dict] = []
+    skipped = 0
 
-async def generate_shifts(
+    for current in iter_weekday_dates(rs.weekday, from_date, until_date):
+        if current in skip:
+            skipped += 1
+            continue
+        rows.append(dict(
+            tenant_id=rs.tenant_id,
+            employee_id=rs.employee_id,
+            template_id=rs.template_id,
+            shift_type_id=rs.shift_type_id,
+            date=current,
+            start_time=rs.start_time,
+            end_time=rs.end_time,
+            break_minutes=rs.break_minutes,
+            status="planned",
+            is_holiday=False,
+            is_weekend=is_weekend,
+            is_sunday=is_sunday,
+            recurring_shift_id=rs.id,
+            is_override=False,
+        ))
+
+    return rows, skipped
+
+
+async def insert_generated_shifts(
     rs: "RecurringShift",
     from_date: date,
     until_date: date,
     profile: "HolidayProfile | None",
     db: AsyncSession,
-) -> tuple[list[Shift], int]:
+) -> tuple[int, int]:
     """
-    Generate Shift objects for every matching weekday in [from_date, until_date]
-    that is not in the skip set. Returns (new_shifts, skipped_count).
+    Generate Shift rows for every matching weekday in [from_date, until_date]
+    that is not in the skip set and write them with a single bulk INSERT
+    (no unit of work). Returns (generated_count, skipped_count).
 
-    Does NOT commit – caller is responsible for db.add / db.commit.
+    Does NOT commit – caller is responsible for db.commit.
     """
-    years = set(range(from_date.year, until_date.year + 1))
-    skip = build_skip_set(profile, rs.skip_public_holidays, years)
-
-    new_shifts: list[Shift] = []
-    skipped = 0
-    current = from_date
-
-    while current <= until_date:
-        if current.weekday() == rs.weekday:
-            if current in skip:
-                skipped += 1
-            else:
-                shift = Shift(
-                    tenant_id=rs.tenant_id,
-                    employee_id=rs.employee_id,
-                    template_id=rs.template_id,
-                    shift_type_id=rs.shift_type_id,
-                    date=current,
-                    start_time=rs.start_time,
-                    end_time=rs.end_time,
-                    break_minutes=rs.break_minutes,
-                    status="planned",
-                    is_holiday=False,
-                    is_weekend=current.weekday() >= 5,
-                    is_sunday=current.weekday() == 6,
-                    recurring_shift_id=rs.id,
-                    is_override=False,
-                )
-                new_shifts.append(shift)
-        current += timedelta(days=1)
-
-    return new_shifts, skipped
+    rows, skipped = build_shift_rows(rs, from_date, until_date, profile)
+    if rows:
+        await db.execute(insert(Shift), rows)
+    return len(rows), skipped
 
 
 async def delete_future_planned_shifts(
@@ -108,7 +154,7 @@ async def delete_future_planned_shifts(
     on or after from_date. Returns the count of deleted shifts.
     """
     result = await db.execute(
-        select(Shift).where(
+        delete(Shift).where(
             and_(
                 Shift.recurring_shift_id == rs_id,
                 Shift.tenant_id == tenant_id,
@@ -118,10 +164,7 @@ async def delete_future_planned_shifts(
             )
         )
     )
-    shifts = result.scalars().all()
-    for s in shifts:
-        await db.delete(s)
-    return len(shifts)
+    return result.rowcount
 
 
 async def preview_generate(
@@ -135,21 +178,18 @@ async def preview_generate(
     Preview how many shifts would be generated without touching the DB.
     """
     years = set(range(from_date.year, until_date.year + 1))
-    skip = build_skip_set(profile, skip_public_holidays, years)
+    skip = SkipDates(profile, skip_public_holidays, years)
 
     generated = 0
     skipped = 0
     skipped_dates: list[str] = []
-    current = from_date
-
-    while current <= until_date:
-        if current.weekday() == weekday:
-            if current in skip:
-                skipped += 1
-                skipped_dates.append(current.isoformat())
-            else:
-                generated += 1
-        current += timedelta(days=1)
+
+    for current in iter_weekday_dates(weekday, from_date, until_date):
+        if current in skip:
+            skipped += 1
+            skipped_dates.append(current.isoformat())
+        else:
+            generated += 1
 
     return {
         "generated_count": generated,
@@ -1,5 +1,9 @@
+import asyncio
+import threading
+
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_process_init
 
 from app.core.config import settings
 
@@ -39,3 +43,28 @@ celery_app.conf.update(
         },
     },
 )
+
+
+# ── Persistente Event-Loop pro Worker ─────────────────────────────────────────
+# Statt asyncio.run() (neue Loop + Teardown bei jedem Task-Aufruf) nutzt jeder
+# Worker-Thread eine eigene, langlebige Loop. Der Redis-Client aus
+# app.core.redis bleibt dadurch auch über Task-Aufrufe hinweg an dieselbe Loop
+# gebunden. Die DB-Tasks nutzen weiterhin TaskSessionLocal (NullPool).
+
+_loop_local = threading.local()
+
+
+@worker_process_init.connect
+def _reset_worker_loop(**_kwargs):
+    """Nach dem Fork keine vom Parent geerbte Loop weiterverwenden."""
+    _loop_local.loop = None
+
+
+def run_async(coro):
+    """Führt eine Coroutine auf der persistenten Loop des aktuellen Threads aus."""
+    loop = getattr(_loop_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _loop_local.loop = loop
+    return loop.run_until_complete(coro)
@@ -1,44 +1,56 @@
 """
 Celery-Tasks für automatische Lohnabrechnungen.
 """
-from app.tasks.celery_app import celery_app
+import logging
+from datetime import date, timedelta
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import select
+
+from app.core import database
+from app.models.employee import Employee
+from app.models.payroll import PayrollEntry, HoursCarryover
+from app.services.payroll_service import PayrollService
+from app.tasks.celery_app import celery_app, run_async
+
+logger = logging.getLogger(__name__)
+
+# Alle N neu berechneten Abrechnungen wird geflusht, damit die Session klein bleibt
+FLUSH_BATCH_SIZE = 50
 
 
 @celery_app.task(name="app.tasks.payroll_tasks.create_monthly_payrolls")
 def create_monthly_payrolls():
     """Erstellt Lohnabrechnungen für den Vormonat für alle aktiven Mitarbeiter."""
-    import asyncio
-    asyncio.run(_create_payrolls())
+    run_async(_create_payrolls())
 
 
 async def _create_payrolls():
-    from datetime import date
-    from dateutil.relativedelta import relativedelta
-    from sqlalchemy import select
-    from app.core.database import TaskSessionLocal as AsyncSessionLocal
-    from app.models.employee import Employee
-    from app.models.payroll import PayrollEntry
-    from app.services.payroll_service import PayrollService
-
-    last_month = date.today().replace(day=1) - __import__('datetime').timedelta(days=1)
+    last_month = date.today().replace(day=1) - timedelta(days=1)
     month = last_month.replace(day=1)
+    next_month = month + relativedelta(months=1)
 
-    async with AsyncSessionLocal() as db:
+    # TaskSessionLocal zur Laufzeit auflösen (Tests patchen app.core.database)
+    async with database.TaskSessionLocal() as db:
+        # Nur die Spalten laden, die für die Schleife gebraucht werden –
+        # PayrollService lädt den Mitarbeiter ohnehin selbst nach.
         result = await db.execute(
-            select(Employee).where(Employee.is_active == True)
+            select(Employee.id, Employee.tenant_id).where(Employee.is_active == True)
         )
-        employees = result.scalars().all()
+        employees = result.all()
+
+        # Bereits vorhandene Einträge des Monats in einer Abfrage vorab laden
+        # statt pro Mitarbeiter einzeln nachzufragen.
+        existing_result = await db.execute(
+            select(PayrollEntry.employee_id).where(PayrollEntry.month == month)
+        )
+        existing_ids = set(existing_result.scalars().all())
 
         payroll_svc = PayrollService(db)
+        pending = 0
         for employee in employees:
             # Nur erstellen wenn noch kein Eintrag vorhanden
-            existing = await db.execute(
-                select(PayrollEntry).where(
-                    PayrollEntry.employee_id == employee.id,
-                    PayrollEntry.month == month,
-                )
-            )
-            if existing.scalar_one_or_none():
+            if employee.id in existing_ids:
                 continue
 
             try:
@@ -47,8 +59,6 @@ async def _create_payrolls():
 
                 # Übertrag für Folgemonat anlegen wenn nötig
                 if abs(new_carryover) > 0.01:
-                    from app.models.payroll import HoursCarryover
-                    next_month = (month.replace(day=28) + __import__('datetime').timedelta(days=4)).replace(day=1)
                     carryover = HoursCarryover(
                         tenant_id=employee.tenant_id,
                         employee_id=employee.id,
@@ -59,10 +69,11 @@ async def _create_payrolls():
                     )
                     db.add(carryover)
 
+                pending += 1
+                if pending % FLUSH_BATCH_SIZE == 0:
+                    await db.flush()
+
             except Exception as e:
-                import logging
-                logging.getLogger(__name__).error(
-                    f"Payroll error for employee {employee.id}: {e}"
-                )
+                logger.error(f"Payroll error for employee {employee.id}: {e}")
 
         await db.commit()
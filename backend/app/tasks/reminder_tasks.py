@@ -8,11 +8,24 @@ Logik:
   (unabhängig vom Diensttyp, nur wenn Event-Pref "shift_reminder" aktiviert)
 """
 import logging
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
-from app.tasks.celery_app import celery_app
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.core import database
+from app.core.redis import get_redis
+from app.models.shift import Shift
+from app.models.shift_type import ShiftType
+from app.services.notification_service import NotificationService, EVENT_SHIFT_REMINDER
+from app.tasks.celery_app import celery_app, run_async
 
 logger = logging.getLogger(__name__)
 
+BERLIN = ZoneInfo("Europe/Berlin")
+
 # Redis-Key Präfix für gesendete Typ-Erinnerungen (TTL 48h)
 REDIS_PREFIX = "vera:reminder:type:"
 REDIS_TTL    = 48 * 3600  # 48 Stunden
@@ -28,33 +41,22 @@ def send_type_reminders():
     und die im Fenster [now, now + reminder_minutes_before] beginnen.
     Deduplizierung via Redis (ein Dienst bekommt seine Typ-Erinnerung nur einmal).
     """
-    import asyncio
-    asyncio.run(_run_type_reminders())
+    run_async(_run_type_reminders())
 
 
 @celery_app.task(name="app.tasks.reminder_tasks.send_daily_reminders")
 def send_daily_reminders():
     """Täglich 08:00: generelle 24h-Erinnerung für alle Dienste morgen."""
-    import asyncio
-    from datetime import date, timedelta
-    asyncio.run(_send_reminders_for_date(date.today() + timedelta(days=1), hours_before=24))
+    run_async(_send_reminders_for_date(date.today() + timedelta(days=1), hours_before=24))
 
 
 # ── Kern-Logik: Diensttyp-basierte Erinnerungen ───────────────────────────────
 
 async def _run_type_reminders():
-    from datetime import datetime, timezone, timedelta, date as date_type
-    from sqlalchemy import select
-    from sqlalchemy.orm import selectinload
-    from app.core.database import TaskSessionLocal as AsyncSessionLocal
-    from app.models.shift import Shift
-    from app.models.shift_type import ShiftType
-    from app.core.redis import get_redis
-
     now = datetime.now(timezone.utc)
 
     try:
-        async with AsyncSessionLocal() as db:
+        async with database.TaskSessionLocal() as db:
             # Lade alle aktiven Diensttypen mit Erinnerung
             st_result = await db.execute(
                 select(ShiftType).where(
@@ -67,14 +69,20 @@ async def _run_type_reminders():
             if not shift_types:
                 return
 
-            # Suche Dienste der nächsten 24h mit einem dieser Typen
-            tomorrow = (now + timedelta(hours=24)).date()
+            # Nur Dienste laden, deren Erinnerungsfenster jetzt offen sein kann:
+            # start - minutes_before <= now <= start - minutes_before + 5min
+            # → Dienstdatum (Berlin) liegt zwischen now + min(before) - 5min
+            #   und now + max(before). Spart das Laden aller Dienste der nächsten 24h.
+            now_berlin = now.astimezone(BERLIN)
+            minutes_before = [st.reminder_minutes_before for st in shift_types.values()]
+            first_date = (now_berlin + timedelta(minutes=min(minutes_before) - 5)).date()
+            last_date = (now_berlin + timedelta(minutes=max(minutes_before))).date()
             result = await db.execute(
                 select(Shift)
                 .options(selectinload(Shift.employee))
                 .where(
-                    Shift.date <= tomorrow,
-                    Shift.date >= now.date(),
+                    Shift.date <= last_date,
+                    Shift.date >= first_date,
                     Shift.shift_type_id.in_(shift_types.keys()),
                     Shift.status.in_(["planned", "confirmed"]),
                     Shift.employee_id.isnot(None),
@@ -82,27 +90,19 @@ async def _run_type_reminders():
             )
             shifts = result.scalars().all()
 
-        redis = await get_redis()
-
+        # Erst rein rechnerisch die fälligen Dienste bestimmen – Redis wird nur
+        # für diese (typischerweise 0–2 pro Lauf) befragt, nicht für jeden Kandidaten.
+        due = []
         for shift in shifts:
             st = shift_types.get(shift.shift_type_id)
             if not st or not shift.employee:
                 continue
 
-            redis_key = f"{REDIS_PREFIX}{shift.id}"
-
-            # Bereits gesendet?
-            if await redis.exists(redis_key):
-                continue
-
             # Dienstbeginn in Berlin-Zeit berechnen
-            from zoneinfo import ZoneInfo
-            from datetime import datetime as dt
-            berlin = ZoneInfo("Europe/Berlin")
-            shift_start = dt(
+            shift_start = datetime(
                 shift.date.year, shift.date.month, shift.date.day,
                 shift.start_time.hour, shift.start_time.minute,
-                tzinfo=berlin,
+                tzinfo=BERLIN,
             )
             shift_start_utc = shift_start.astimezone(timezone.utc)
 
@@ -111,14 +111,28 @@ async def _run_type_reminders():
             remind_until = remind_at + timedelta(minutes=5)
 
             if remind_at <= now <= remind_until:
-                # Erinnerung schicken
-                send_shift_reminder.delay(
-                    str(shift.id),
-                    hours_before=round(st.reminder_minutes_before / 60, 1),
-                    shift_type_name=st.name,
-                )
-                # Deduplizierungs-Key setzen
-                await redis.setex(redis_key, REDIS_TTL, "sent")
+                due.append((shift, st))
+
+        if not due:
+            return
+
+        redis = await get_redis()
+
+        for shift, st in due:
+            redis_key = f"{REDIS_PREFIX}{shift.id}"
+
+            # Bereits gesendet?
+            if await redis.exists(redis_key):
+                continue
+
+            # Erinnerung schicken
+            send_shift_reminder.delay(
+                str(shift.id),
+                hours_before=round(st.reminder_minutes_before / 60, 1),
+                shift_type_name=st.name,
+            )
+            # Deduplizierungs-Key setzen
+            await redis.setex(redis_key, REDIS_TTL, "sent")
 
     except Exception as e:
         logger.error("Typ-Erinnerungen fehlgeschlagen: %s", e, exc_info=True)
@@ -127,22 +141,20 @@ async def _run_type_reminders():
 # ── Kern-Logik: tägliche generelle Erinnerungen ───────────────────────────────
 
 async def _send_reminders_for_date(target_date, hours_before: int = 24):
-    from sqlalchemy import select
-    from app.core.database import TaskSessionLocal as AsyncSessionLocal
-    from app.models.shift import Shift
-
     try:
-        async with AsyncSessionLocal() as db:
+        async with database.TaskSessionLocal() as db:
+            # Nur die IDs werden gebraucht → keine vollständigen Shift-Objekte laden
             result = await db.execute(
-                select(Shift).where(
+                select(Shift.id).where(
                     Shift.date == target_date,
                     Shift.status.in_(["planned", "confirmed"]),
                     Shift.employee_id.isnot(None),
                 )
             )
-            shifts = result.scalars().all()
-            for shift in shifts:
-                send_shift_reminder.delay(str(shift.id), hours_before=hours_before)
+            shift_ids = [str(shift_id) for shift_id in result.scalars()]
+        # Ein einziger Task für alle Dienste statt einem Broker-Roundtrip pro Dienst
+        if shift_ids:
+            send_shift_reminders_batch.delay(shift_ids, hours_before=hours_before)
     except Exception as e:
         logger.error("Tageserinnerungen fehlgeschlagen für %s: %s", target_date, e, exc_info=True)
 
@@ -152,69 +164,100 @@ async def _send_reminders_for_date(target_date, hours_before: int = 24):
 @celery_app.task(name="app.tasks.reminder_tasks.send_shift_reminder")
 def send_shift_reminder(shift_id: str, hours_before: float = 24, shift_type_name: str | None = None):
     """Sendet eine Erinnerung für einen konkreten Dienst."""
-    import asyncio
-    asyncio.run(_do_send_reminder(shift_id, hours_before, shift_type_name))
+    run_async(_do_send_reminder(shift_id, hours_before, shift_type_name))
 
 
 async def _do_send_reminder(shift_id: str, hours_before: float, shift_type_name: str | None):
-    import uuid
-    from sqlalchemy import select
-    from sqlalchemy.orm import selectinload
-    from app.core.database import TaskSessionLocal as AsyncSessionLocal
-    from app.models.shift import Shift
-    from app.services.notification_service import NotificationService, EVENT_SHIFT_REMINDER
-
-    async with AsyncSessionLocal() as db:
+    async with database.TaskSessionLocal() as db:
         result = await db.execute(
             select(Shift)
             .options(selectinload(Shift.employee))
             .where(Shift.id == uuid.UUID(shift_id))
         )
         shift = result.scalar_one_or_none()
-        if not shift or not shift.employee:
+        if not shift:
             return
+        await _dispatch_reminder(db, shift, hours_before, shift_type_name)
 
-        emp = shift.employee
-        prefs  = emp.notification_prefs or {}
-        events = prefs.get("events", {})
-        if not events.get(EVENT_SHIFT_REMINDER, True):
-            return
 
-        weekdays = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
-        wday = weekdays[shift.date.weekday()]
-
-        # Zeitangabe
-        if hours_before < 1:
-            time_label = f"{int(hours_before * 60)} Minuten"
-        elif hours_before == int(hours_before):
-            time_label = f"{int(hours_before)} Stunde(n)"
-        else:
-            time_label = f"{hours_before:.1f} Stunden"
-
-        type_line = f"Typ:    {shift_type_name}\n" if shift_type_name else ""
-
-        msg = (
-            f"Hallo {emp.first_name},\n\n"
-            f"Erinnerung: Dein Dienst beginnt in {time_label}.\n"
-            f"Datum:  {wday}, {shift.date.strftime('%d.%m.%Y')}\n"
-            f"Zeit:   {shift.start_time.strftime('%H:%M')} – {shift.end_time.strftime('%H:%M')} Uhr\n"
-            f"{type_line}"
-        )
-        if shift.location:
-            msg += f"Ort:    {shift.location}\n"
-        msg += "\nVERA Schichtplanner"
-
-        subject = (
-            f"{'[' + shift_type_name + '] ' if shift_type_name else ''}"
-            f"Erinnerung: Dienst am {shift.date.strftime('%d.%m.%Y')} "
-            f"um {shift.start_time.strftime('%H:%M')} Uhr"
-        )
+@celery_app.task(name="app.tasks.reminder_tasks.send_shift_reminders_batch")
+def send_shift_reminders_batch(shift_ids: list[str], hours_before: float = 24):
+    """Sendet Erinnerungen für mehrere Dienste in einer gemeinsamen DB-Session."""
+    run_async(_do_send_reminders_batch(shift_ids, hours_before))
+
 
-        svc = NotificationService(db)
-        await svc.dispatch(
-            employee=emp,
-            event_type=EVENT_SHIFT_REMINDER,
-            message=msg,
-            subject=subject,
-            tenant_id=shift.tenant_id,
+async def _do_send_reminders_batch(shift_ids: list[str], hours_before: float):
+    if not shift_ids:
+        return
+
+    async with database.TaskSessionLocal() as db:
+        result = await db.execute(
+            select(Shift)
+            .options(selectinload(Shift.employee))
+            .where(Shift.id.in_([uuid.UUID(sid) for sid in shift_ids]))
+            .order_by(Shift.date, Shift.start_time)
         )
+        shifts = result.scalars().all()
+        # Geladene Dienste/Mitarbeiter von der Session lösen: ein rollback() nach
+        # einem Fehler lässt sie dann nicht verfallen (kein Lazy-Load im async-Kontext)
+        db.expunge_all()
+
+        for shift in shifts:
+            shift_id = shift.id
+            try:
+                await _dispatch_reminder(db, shift, hours_before, None)
+            except Exception as e:
+                # Ein fehlerhafter Dienst darf den Rest des Batches nicht blockieren
+                await db.rollback()
+                logger.error("Erinnerung für Dienst %s fehlgeschlagen: %s", shift_id, e, exc_info=True)
+
+
+async def _dispatch_reminder(db, shift, hours_before: float, shift_type_name: str | None):
+    """Baut die Erinnerungsnachricht für einen geladenen Dienst und versendet sie."""
+    if not shift.employee:
+        return
+
+    emp = shift.employee
+    prefs  = emp.notification_prefs or {}
+    events = prefs.get("events", {})
+    if not events.get(EVENT_SHIFT_REMINDER, True):
+        return
+
+    weekdays = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
+    wday = weekdays[shift.date.weekday()]
+
+    # Zeitangabe
+    if hours_before < 1:
+        time_label = f"{int(hours_before * 60)} Minuten"
+    elif hours_before == int(hours_before):
+        time_label = f"{int(hours_before)} Stunde(n)"
+    else:
+        time_label = f"{hours_before:.1f} Stunden"
+
+    type_line = f"Typ:    {shift_type_name}\n" if shift_type_name else ""
+
+    msg = (
+        f"Hallo {emp.first_name},\n\n"
+        f"Erinnerung: Dein Dienst beginnt in {time_label}.\n"
+        f"Datum:  {wday}, {shift.date.strftime('%d.%m.%Y')}\n"
+        f"Zeit:   {shift.start_time.strftime('%H:%M')} – {shift.end_time.strftime('%H:%M')} Uhr\n"
+        f"{type_line}"
+    )
+    if shift.location:
+        msg += f"Ort:    {shift.location}\n"
+    msg += "\nVERA Schichtplanner"
+
+    subject = (
+        f"{'[' + shift_type_name + '] ' if shift_type_name else ''}"
+        f"Erinnerung: Dienst am {shift.date.strftime('%d.%m.%Y')} "
+        f"um {shift.start_time.strftime('%H:%M')} Uhr"
+    )
+
+    svc = NotificationService(db)
+    await svc.dispatch(
+        employee=emp,
+        event_type=EVENT_SHIFT_REMINDER,
+        message=msg,
+        subject=subject,
+        tenant_id=shift.tenant_id,
+    )
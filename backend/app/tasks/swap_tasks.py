@@ -2,8 +2,16 @@
 Celery-Task: abgelaufene Schichttausch-Angebote (Dienst-Abgabe) markieren.
 """
 import logging
+from datetime import datetime, timezone
 
-from app.tasks.celery_app import celery_app
+from sqlalchemy import select
+
+from app.core import database
+from app.models.employee import Employee
+from app.models.shift import Shift
+from app.models.shift_swap import ShiftSwapOffer
+from app.services.notification_service import NotificationService
+from app.tasks.celery_app import celery_app, run_async
 
 logger = logging.getLogger(__name__)
 
@@ -11,20 +19,13 @@ logger = logging.getLogger(__name__)
 @celery_app.task(name="app.tasks.swap_tasks.expire_swap_offers")
 def expire_swap_offers():
     """Läuft alle 15 Minuten: setzt Angebote mit abgelaufener Frist auf 'expired'."""
-    import asyncio
-    asyncio.run(_expire_swap_offers())
+    run_async(_expire_swap_offers())
 
 
 async def _expire_swap_offers():
-    from datetime import datetime, timezone
-    from sqlalchemy import select
-    from app.core.database import TaskSessionLocal
-    from app.models.shift_swap import ShiftSwapOffer
-    from app.services.notification_service import notify_swap_cancelled
-
     try:
         now = datetime.now(timezone.utc)
-        async with TaskSessionLocal() as db:
+        async with database.TaskSessionLocal() as db:
             result = await db.execute(
                 select(ShiftSwapOffer).where(
                     ShiftSwapOffer.status == "open",
@@ -44,10 +45,6 @@ async def _expire_swap_offers():
 
 async def notify_swap_expired(offer, db) -> None:
     """Anbieter informieren: niemand hat übernommen, Dienst bleibt bei ihm."""
-    from app.models.employee import Employee
-    from app.models.shift import Shift
-    from app.services.notification_service import NotificationService
-
     offering_emp = await db.get(Employee, offer.offering_employee_id)
     if not offering_emp:
         return
@@ -2,9 +2,20 @@
 Deutsche Feiertage für Baden-Württemberg.
 Verwendet workalendar für gesetzliche Feiertage + vorbelegte Schulferien BW.
 """
-from datetime import date
+from bisect import bisect_right
+from collections.abc import Mapping
+from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from typing import NamedTuple
 
+try:
+    from workalendar.europe import BadenWurttemberg
+    _BW_CALENDAR = BadenWurttemberg()
+except ImportError:
+    # workalendar ist optional – dann greift der hartcodierte Fallback
+    _BW_CALENDAR = None
+
 
 class HolidayInfo(NamedTuple):
     date: date
@@ -33,42 +44,56 @@ BW_SCHOOL_HOLIDAYS_2026_27: list[tuple[date, date, str]] = [
     (date(2027, 7, 29),  date(2027, 9, 11),  "Sommer"),
 ]
 
-
-def get_bw_holidays(year: int) -> dict[date, str]:
-    """Gibt alle gesetzlichen Feiertage in BW für ein Jahr zurück."""
-    try:
-        from workalendar.europe import BadenWurttemberg
-        cal = BadenWurttemberg()
-        return {d: name for d, name in cal.holidays(year)}
-    except ImportError:
-        # Fallback: Hartcodierte BW-Feiertage für 2025/2026
+# Sortierte, disjunkte Ferienintervalle aller Schuljahre als parallele Listen
+# → is_school_holiday findet das Kandidatenintervall per bisect statt per Scan.
+_SCHOOL_HOLIDAY_RANGES = sorted(BW_SCHOOL_HOLIDAYS_2025_26 + BW_SCHOOL_HOLIDAYS_2026_27)
+_SCHOOL_HOLIDAY_STARTS = [start for start, _, _ in _SCHOOL_HOLIDAY_RANGES]
+_SCHOOL_HOLIDAY_ENDS = [end for _, end, _ in _SCHOOL_HOLIDAY_RANGES]
+_SCHOOL_HOLIDAY_NAMES = [name for _, _, name in _SCHOOL_HOLIDAY_RANGES]
+
+
+@lru_cache(maxsize=32)
+def get_bw_holidays(year: int) -> Mapping[date, str]:
+    """
+    Gibt alle gesetzlichen Feiertage in BW für ein Jahr zurück.
+    Ergebnis wird pro Jahr gecacht und ist daher schreibgeschützt.
+    """
+    if _BW_CALENDAR is None:
+        # Fallback: Hartcodierte BW-Feiertage
         return _hardcoded_bw_holidays(year)
-
-
-def _hardcoded_bw_holidays(year: int) -> dict[date, str]:
+    return MappingProxyType({d: name for d, name in _BW_CALENDAR.holidays(year)})
+
+
+@lru_cache(maxsize=32)
+def get_bw_holiday_dates(year: int) -> frozenset[date]:
+    """Nur die Feiertags-Daten eines Jahres (gecacht, z.B. für Skip-Sets)."""
+    return frozenset(get_bw_holidays(year))
+
+
+@lru_cache(maxsize=64)
+def _easter(year: int) -> date:
+    """Gauss'sche Osterformel."""
+    a = year % 19
+    b = year // 100
+    c = year % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month = (h + l - 7 * m + 114) // 31
+    day = ((h + l - 7 * m + 114) % 31) + 1
+    return date(year, month, day)
+
+
+@lru_cache(maxsize=16)
+def _hardcoded_bw_holidays(year: int) -> Mapping[date, str]:
     """Fallback für gesetzliche Feiertage BW (wenn workalendar nicht verfügbar)."""
-    from datetime import timedelta
-    import math
-
-    def easter(year: int) -> date:
-        """Gauss'sche Osterformel."""
-        a = year % 19
-        b = year // 100
-        c = year % 100
-        d = b // 4
-        e = b % 4
-        f = (b + 8) // 25
-        g = (b - f + 1) // 3
-        h = (19 * a + b - d - g + 15) % 30
-        i = c // 4
-        k = c % 4
-        l = (32 + 2 * e + 2 * i - h - k) % 7
-        m = (a + 11 * h + 22 * l) // 451
-        month = (h + l - 7 * m + 114) // 31
-        day = ((h + l - 7 * m + 114) % 31) + 1
-        return date(year, month, day)
-
-    e = easter(year)
+    e = _easter(year)
     holidays = {
         date(year, 1, 1):   "Neujahr",
         date(year, 1, 6):   "Heilige Drei Könige",
@@ -85,7 +110,7 @@ def _hardcoded_bw_holidays(year: int) -> dict[date, str]:
         date(year, 12, 25): "1. Weihnachtstag",
         date(year, 12, 26): "2. Weihnachtstag",
     }
-    return holidays
+    return MappingProxyType(holidays)
 
 
 def is_holiday(d: date, state: str = "BW") -> tuple[bool, str | None]:
@@ -97,10 +122,9 @@ def is_holiday(d: date, state: str = "BW") -> tuple[bool, str | None]:
 
 def is_school_holiday(d: date) -> tuple[bool, str | None]:
     """Prueft ob ein Datum in BW-Schulferien faellt. Auto-selects correct school year."""
-    for holiday_list in [BW_SCHOOL_HOLIDAYS_2025_26, BW_SCHOOL_HOLIDAYS_2026_27]:
-        for start, end, name in holiday_list:
-            if start <= d <= end:
-                return True, name
+    i = bisect_right(_SCHOOL_HOLIDAY_STARTS, d) - 1
+    if i >= 0 and d <= _SCHOOL_HOLIDAY_ENDS[i]:
+        return True, _SCHOOL_HOLIDAY_NAMES[i]
     return False, None
 
 
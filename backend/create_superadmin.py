@@ -24,7 +24,7 @@ async def main(email: str, password: str) -> None:
         sys.exit(1)
 
     async with AsyncSessionLocal() as db:
-        existing = await db.execute(select(SuperAdmin).where(SuperAdmin.email == email))
+        existing = await db.execute(select(SuperAdmin.id).where(SuperAdmin.email == email))
         if existing.scalar_one_or_none():
             print(f"SuperAdmin mit E-Mail '{email}' existiert bereits.")
             sys.exit(0)
@@ -34,8 +34,8 @@ async def main(email: str, password: str) -> None:
             hashed_password=hash_password(password),
         )
         db.add(sa)
+        # id kommt aus dem Python-Default (uuid4), expire_on_commit=False → kein refresh-SELECT nötig
         await db.commit()
-        await db.refresh(sa)
         print(f"✓ SuperAdmin '{email}' wurde erstellt (ID: {sa.id})")
 
 
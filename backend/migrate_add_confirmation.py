@@ -7,6 +7,10 @@ import os
 
 db_path = os.path.join(os.path.dirname(__file__), "vera.db")
 con = sqlite3.connect(db_path)
+# Nur für diese Verbindung: Temp-B-Trees im RAM. journal_mode und synchronous bleiben
+# bewusst auf dem Default – WAL wäre persistent, synchronous=NORMAL im Rollback-Journal
+# bei Stromausfall während des Commits nicht crashsicher.
+con.execute("PRAGMA temp_store=MEMORY")
 
 columns = {
     "confirmed_by":       "TEXT",
@@ -16,6 +20,10 @@ columns = {
 
 existing = {row[1] for row in con.execute("PRAGMA table_info(shifts)")}
 
+# Schreib-Transaktion nur, wenn auch etwas zu tun ist – alle ALTERs darin, ein Commit
+if not existing.issuperset(columns):
+    con.execute("BEGIN IMMEDIATE")
+
 for col, col_type in columns.items():
     if col not in existing:
         con.execute(f"ALTER TABLE shifts ADD COLUMN {col} {col_type}")
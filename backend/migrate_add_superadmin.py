@@ -7,6 +7,12 @@ import os
 
 DB_PATH = os.environ.get("SQLITE_PATH", "vera.db")
 con = sqlite3.connect(DB_PATH)
+# Nur für diese Verbindung: Temp-B-Trees im RAM. journal_mode und synchronous bleiben
+# bewusst auf dem Default – WAL wäre persistent, synchronous=NORMAL im Rollback-Journal
+# bei Stromausfall während des Commits nicht crashsicher.
+con.execute("PRAGMA temp_store=MEMORY")
+# Alle Schritte schreiben → eine Schreib-Transaktion, ein Commit am Ende
+con.execute("BEGIN IMMEDIATE")
 
 try:
     con.execute("""
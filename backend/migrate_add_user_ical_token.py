@@ -2,20 +2,32 @@
 Migration: ical_token auf users-Tabelle hinzufügen.
 Ausführen: .venv/bin/python migrate_add_user_ical_token.py
 """
-import sqlite3, secrets, os
+import sqlite3, secrets, os, base64
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "vera.db")
 con = sqlite3.connect(DB_PATH)
+# Nur für diese Verbindung: Temp-B-Trees im RAM. journal_mode und synchronous bleiben
+# bewusst auf dem Default – WAL wäre persistent, synchronous=NORMAL im Rollback-Journal
+# bei Stromausfall während des Commits nicht crashsicher.
+con.execute("PRAGMA temp_store=MEMORY")
 cur = con.cursor()
 
 cols = [row[1] for row in cur.execute("PRAGMA table_info(users)")]
 if "ical_token" not in cols:
+    # Schreib-Transaktion nur auf diesem Zweig: ALTER + Befüllen, ein Commit
+    con.execute("BEGIN IMMEDIATE")
     cur.execute("ALTER TABLE users ADD COLUMN ical_token TEXT")
     # Generate unique token for each existing user
+    # (executemany statt UPDATE-Aufruf je User)
     users = cur.execute("SELECT id FROM users").fetchall()
-    for (uid,) in users:
-        cur.execute("UPDATE users SET ical_token = ? WHERE id = ?",
-                    (secrets.token_urlsafe(32), uid))
+    # Ein Zufallsblock für alle Tokens, je 32 Bytes wie secrets.token_urlsafe(32)
+    raw = secrets.token_bytes(32 * len(users))
+    tokens = [
+        base64.urlsafe_b64encode(raw[i * 32:(i + 1) * 32]).rstrip(b"=").decode("ascii")
+        for i in range(len(users))
+    ]
+    cur.executemany("UPDATE users SET ical_token = ? WHERE id = ?",
+                    [(token, uid) for token, (uid,) in zip(tokens, users)])
     con.commit()
     print(f"✓ ical_token hinzugefügt und für {len(users)} User befüllt")
 else:
@@ -3,13 +3,25 @@ Shared pytest fixtures for VERA backend tests.
 
 Uses SQLite in-memory with StaticPool so all sessions share one connection,
 meaning data written in one session is visible to others (important for HTTP client tests).
+
+The engine and schema are created once per test session; every test starts from
+empty tables (rows are deleted before each test instead of dropping/recreating
+the schema). All tests and async fixtures share one session-wide event loop so
+the session-scoped engine can be used everywhere.
 """
+import asyncio
 import uuid
-from datetime import datetime, timezone
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from types import MappingProxyType
 
+import bcrypt
 import pytest
 import pytest_asyncio
+from pytest_asyncio import is_async_test
 from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.pool import StaticPool
 
@@ -20,29 +32,97 @@ from app.main import app
 from app.models.tenant import Tenant
 from app.models.user import User
 
+# Plain :memory: + StaticPool on purpose: a shared-cache URI
+# (file:...?mode=memory&cache=shared) would allow a real pool, but shared cache
+# uses table-level locks that fail immediately with SQLITE_LOCKED (busy_timeout
+# does not apply) as soon as the test session and a request session overlap.
+# Each process already gets its own :memory: DB, so pytest-xdist workers
+# (`pytest -n auto`) are isolated without a per-worker database name.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
-# ── Shared engine (function-scoped: fresh DB per test) ───────────────────────
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session-wide event loop (see module docstring)."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
 
-@pytest_asyncio.fixture
-async def engine():
-    """Creates a fresh in-memory SQLite engine per test with a shared connection pool."""
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """
+    uvloop for the session loop when available (installed via uvicorn[standard]).
+
+    pytest-asyncio 0.24 deprecates overriding event_loop; the loop scope comes
+    from the markers above and asyncio_default_fixture_loop_scope in pytest.ini.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_bcrypt():
+    """
+    Lower the bcrypt cost factor to the minimum (4) for the whole run.
+
+    hash_password()/verify_password() keep running the real bcrypt code paths
+    (the cost is encoded in the hash), they are just ~100x cheaper per call.
+    """
+    real_gensalt = bcrypt.gensalt
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bcrypt, "gensalt", lambda rounds=4, prefix=b"2b": real_gensalt(4, prefix))
+        yield
+
+
+# ── Shared engine (session-scoped schema, emptied before each test) ──────────
+
+@pytest_asyncio.fixture(scope="session")
+async def _session_engine():
+    """One in-memory SQLite engine + schema for the whole test run."""
     eng = create_async_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,          # single shared connection → all sessions see same data
     )
+
+    @event.listens_for(eng.sync_engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, _record):
+        # No durability needed for a throwaway DB; temp b-trees (ORDER BY,
+        # GROUP BY) stay in RAM. Foreign keys stay unenforced like in the app.
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA synchronous=OFF")
+        cur.execute("PRAGMA journal_mode=MEMORY")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cur.close()
+
     async with eng.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
     yield eng
 
-    async with eng.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
     await eng.dispose()
 
 
+# Children before parents; built once and sent as one script per test
+_WIPE_SCRIPT = "".join(
+    f'DELETE FROM "{table.name}";' for table in reversed(Base.metadata.sorted_tables)
+)
+
+
+@pytest_asyncio.fixture
+async def engine(_session_engine):
+    """The shared engine with all tables emptied – each test sees a fresh, empty DB."""
+    async with _session_engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.executescript(_WIPE_SCRIPT)
+    return _session_engine
+
+
 @pytest_asyncio.fixture
 async def db(engine) -> AsyncSession:
     """Async DB session for direct data inspection inside tests."""
@@ -53,14 +133,14 @@ async def db(engine) -> AsyncSession:
 
 # ── HTTP client fixture ───────────────────────────────────────────────────────
 
-@pytest_asyncio.fixture
-async def client(engine) -> AsyncClient:
+@pytest_asyncio.fixture(scope="session")
+async def _session_client(_session_engine) -> AsyncClient:
     """
-    FastAPI test client with get_db overridden to use the test engine.
-    Each request gets its own session (proper handling) but shares the same
-    underlying connection via StaticPool.
+    FastAPI test client with get_db overridden to use the test engine, built once
+    per test session. Each request gets its own session (proper handling) but
+    shares the same underlying connection via StaticPool.
     """
-    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    session_factory = async_sessionmaker(_session_engine, class_=AsyncSession, expire_on_commit=False)
 
     async def override_get_db():
         async with session_factory() as session:
@@ -78,25 +158,50 @@ async def client(engine) -> AsyncClient:
     ) as c:
         yield c
 
-    app.dependency_overrides.clear()
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture
+async def client(engine, _session_client) -> AsyncClient:
+    """Per test: empty DB (via engine) and no cookies left over from earlier tests."""
+    _session_client.cookies.clear()
+    return _session_client
 
 
 # ── Tenant + User fixtures ────────────────────────────────────────────────────
 
+# IDs and timestamps are set explicitly and all other columns have Python-side
+# defaults (populated on flush), so the fixtures commit without a refresh SELECT.
+#
+# The IDs are fixed for the whole run: tables are emptied before every test, so
+# reusing them never collides, and it lets the access tokens be signed only once.
+_TENANT_ID = uuid.uuid4()
+_TENANT_B_ID = uuid.uuid4()
+_ADMIN_ID = uuid.uuid4()
+_ADMIN_B_ID = uuid.uuid4()
+_EMPLOYEE_ID = uuid.uuid4()
+# One timestamp for all fixture rows; no test depends on their exact creation time
+_FIXTURE_NOW = datetime.now(timezone.utc)
+
+@cache
+def _test_password_hash() -> str:
+    """bcrypt hash of "testpass123", computed once per run instead of per user fixture."""
+    return hash_password("testpass123")
+
+
 @pytest_asyncio.fixture
 async def tenant(db) -> Tenant:
     t = Tenant(
-        id=uuid.uuid4(),
+        id=_TENANT_ID,
         name="Test GmbH",
         slug=f"test-{uuid.uuid4().hex[:8]}",
         state="BW",
         is_active=True,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=_FIXTURE_NOW,
+        updated_at=_FIXTURE_NOW,
     )
     db.add(t)
     await db.commit()
-    await db.refresh(t)
     return t
 
 
@@ -104,87 +209,93 @@ async def tenant(db) -> Tenant:
 async def tenant_b(db) -> Tenant:
     """Second, independent tenant — for cross-tenant isolation/IDOR tests."""
     t = Tenant(
-        id=uuid.uuid4(),
+        id=_TENANT_B_ID,
         name="Tenant B GmbH",
         slug=f"tenant-b-{uuid.uuid4().hex[:8]}",
         state="BW",
         is_active=True,
-        created_at=datetime.now(timezone.utc),
-        updated_at=datetime.now(timezone.utc),
+        created_at=_FIXTURE_NOW,
+        updated_at=_FIXTURE_NOW,
     )
     db.add(t)
     await db.commit()
-    await db.refresh(t)
     return t
 
 
 @pytest_asyncio.fixture
 async def admin_user_b(db, tenant_b) -> User:
     u = User(
-        id=uuid.uuid4(),
+        id=_ADMIN_B_ID,
         tenant_id=tenant_b.id,
         email="admin-b@test.de",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=_test_password_hash(),
         role="admin",
         is_active=True,
-        created_at=datetime.now(timezone.utc),
+        created_at=_FIXTURE_NOW,
     )
     db.add(u)
     await db.commit()
-    await db.refresh(u)
     return u
 
 
 @pytest_asyncio.fixture
 def admin_token_b(admin_user_b) -> str:
-    return create_access_token(admin_user_b.id, admin_user_b.tenant_id, "admin", token_version=admin_user_b.token_version)
+    return _cached_access_token(admin_user_b.id, admin_user_b.tenant_id, "admin", admin_user_b.token_version)
 
 
 @pytest_asyncio.fixture
 async def admin_user(db, tenant) -> User:
     u = User(
-        id=uuid.uuid4(),
+        id=_ADMIN_ID,
         tenant_id=tenant.id,
         email="admin@test.de",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=_test_password_hash(),
         role="admin",
         is_active=True,
-        created_at=datetime.now(timezone.utc),
+        created_at=_FIXTURE_NOW,
     )
     db.add(u)
     await db.commit()
-    await db.refresh(u)
     return u
 
 
 @pytest_asyncio.fixture
 async def employee_user(db, tenant) -> User:
     u = User(
-        id=uuid.uuid4(),
+        id=_EMPLOYEE_ID,
         tenant_id=tenant.id,
         email="employee@test.de",
-        hashed_password=hash_password("testpass123"),
+        hashed_password=_test_password_hash(),
         role="employee",
         is_active=True,
-        created_at=datetime.now(timezone.utc),
+        created_at=_FIXTURE_NOW,
     )
     db.add(u)
     await db.commit()
-    await db.refresh(u)
     return u
 
 
 @pytest_asyncio.fixture
 def admin_token(admin_user) -> str:
-    return create_access_token(admin_user.id, admin_user.tenant_id, "admin", token_version=admin_user.token_version)
+    return _cached_access_token(admin_user.id, admin_user.tenant_id, "admin", admin_user.token_version)
 
 
 @pytest_asyncio.fixture
 def employee_token(employee_user) -> str:
-    return create_access_token(employee_user.id, employee_user.tenant_id, "employee", token_version=employee_user.token_version)
+    return _cached_access_token(employee_user.id, employee_user.tenant_id, "employee", employee_user.token_version)
+
+
+@cache
+def _cached_access_token(user_id, tenant_id, role: str, token_version: int) -> str:
+    """Signed once per run; valid for a day so long runs don't hit the 60 min expiry."""
+    return create_access_token(
+        user_id, tenant_id, role, expires_delta=timedelta(days=1), token_version=token_version,
+    )
 
 
 # ── Helper ────────────────────────────────────────────────────────────────────
 
-def auth_headers(token: str) -> dict:
-    return {"Authorization": f"Bearer {token}"}
+@cache
+def auth_headers(token: str) -> Mapping[str, str]:
+    """Header mapping per token, shared across calls – read-only so it can't be mutated."""
+    return MappingProxyType({"Authorization": f"Bearer {token}"})
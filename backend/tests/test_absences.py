@@ -8,117 +8,109 @@ from tests.conftest import auth_headers
 ABSENCES_URL = "/api/v1/absences"
 SHIFTS_URL = "/api/v1/shifts"
 
+DEFAULT_ABSENCE = {
+    "type": "vacation",
+    "start_date": "2025-09-01",
+    "end_date": "2025-09-02",
+    "days_count": 2,
+}
 
-async def create_employee_record(db, tenant, user=None):
-    """Hilfsfunktion: Employee-Record anlegen und optional mit User verknüpfen."""
-    from app.models.employee import Employee
-    emp = Employee(
-        tenant_id=tenant.id,
-        user_id=user.id if user else None,
-        first_name="Test",
-        last_name="Employee",
-        contract_type="full_time",
-        hourly_rate=14.0,
-        annual_salary_limit=0,
-        vacation_days=30,
+
+async def post_absence(client, token, employee_id, expected_status=201, **overrides):
+    """POST /absences mit DEFAULT_ABSENCE + overrides; prüft den Status-Code."""
+    resp = await client.post(
+        ABSENCES_URL,
+        json={**DEFAULT_ABSENCE, "employee_id": str(employee_id), **overrides},
+        headers=auth_headers(token),
+    )
+    assert resp.status_code == expected_status, resp.text
+    return resp
+
+
+async def set_absence_status(client, token, absence_id, status):
+    """PUT /absences/{id} – Genehmigen/Ablehnen."""
+    return await client.put(
+        f"{ABSENCES_URL}/{absence_id}",
+        json={"status": status},
+        headers=auth_headers(token),
     )
-    db.add(emp)
-    await db.commit()
-    await db.refresh(emp)
-    return emp
+
+
+@pytest.fixture
+def make_employee(db, tenant):
+    """Factory: Employee-Record anlegen und optional mit User verknüpfen (ein Commit, kein refresh)."""
+    from app.models.employee import Employee
+
+    async def _make(user=None, **overrides):
+        emp = Employee(
+            tenant_id=tenant.id,
+            user_id=user.id if user else None,
+            first_name="Test",
+            last_name="Employee",
+            contract_type="full_time",
+            hourly_rate=14.0,
+            annual_salary_limit=0,
+            vacation_days=30,
+            **overrides,
+        )
+        db.add(emp)
+        await db.commit()
+        return emp
+
+    return _make
 
 
 # ── POST /absences ────────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_create_absence_admin(client, admin_token, admin_user, db, tenant):
+async def test_create_absence_admin(client, admin_token, admin_user, db, tenant, make_employee):
     """Admin kann Abwesenheit für beliebigen Mitarbeiter anlegen."""
-    emp = await create_employee_record(db, tenant)
+    emp = await make_employee()
 
-    resp = await client.post(
-        ABSENCES_URL,
-        json={
-            "employee_id": str(emp.id),
-            "type": "vacation",
-            "start_date": "2025-09-01",
-            "end_date": "2025-09-05",
-            "days_count": 5,
-        },
-        headers=auth_headers(admin_token),
-    )
-    assert resp.status_code == 201
+    resp = await post_absence(client, admin_token, emp.id, end_date="2025-09-05", days_count=5)
     data = resp.json()
     assert data["status"] == "pending"
     assert data["type"] == "vacation"
 
 
 @pytest.mark.asyncio
-async def test_create_absence_employee_own(client, employee_token, employee_user, db, tenant):
+async def test_create_absence_employee_own(client, employee_token, employee_user, db, tenant, make_employee):
     """Employee kann Abwesenheit für sich selbst stellen."""
-    emp = await create_employee_record(db, tenant, user=employee_user)
+    emp = await make_employee(user=employee_user)
 
-    resp = await client.post(
-        ABSENCES_URL,
-        json={
-            "employee_id": str(emp.id),
-            "type": "vacation",
-            "start_date": "2025-09-01",
-            "end_date": "2025-09-03",
-            "days_count": 3,
-        },
-        headers=auth_headers(employee_token),
-    )
-    assert resp.status_code == 201
+    resp = await post_absence(client, employee_token, emp.id, end_date="2025-09-03", days_count=3)
     assert resp.json()["status"] == "pending"
 
 
 @pytest.mark.asyncio
 async def test_create_absence_employee_for_other_forbidden(client, employee_token, employee_user,
-                                                            db, tenant):
+                                                            db, tenant, make_employee):
     """Employee kann keine Abwesenheit für andere stellen."""
     # Anderer Employee (kein user verknüpft)
-    other_emp = await create_employee_record(db, tenant)
+    other_emp = await make_employee()
     # Eigener Employee (verknüpft, damit 403 statt 403 "kein Profil")
-    own_emp = await create_employee_record(db, tenant, user=employee_user)
+    own_emp = await make_employee(user=employee_user)
 
-    resp = await client.post(
-        ABSENCES_URL,
-        json={
-            "employee_id": str(other_emp.id),
-            "type": "vacation",
-            "start_date": "2025-09-01",
-            "end_date": "2025-09-03",
-            "days_count": 3,
-        },
-        headers=auth_headers(employee_token),
+    await post_absence(
+        client, employee_token, other_emp.id, expected_status=403,
+        end_date="2025-09-03", days_count=3,
     )
-    assert resp.status_code == 403
 
 
 # ── GET /absences ─────────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
 async def test_list_absences_employee_sees_only_own(client, admin_token, employee_token,
-                                                     admin_user, employee_user, db, tenant):
+                                                     admin_user, employee_user, db, tenant, make_employee):
     """Employee sieht nur eigene Abwesenheiten."""
     # Eigener Mitarbeiter
-    own_emp = await create_employee_record(db, tenant, user=employee_user)
+    own_emp = await make_employee(user=employee_user)
     # Anderer Mitarbeiter
-    other_emp = await create_employee_record(db, tenant)
+    other_emp = await make_employee()
 
     # Admin legt Abwesenheiten für beide an
     for emp_id in [own_emp.id, other_emp.id]:
-        await client.post(
-            ABSENCES_URL,
-            json={
-                "employee_id": str(emp_id),
-                "type": "sick",
-                "start_date": "2025-09-01",
-                "end_date": "2025-09-01",
-                "days_count": 1,
-            },
-            headers=auth_headers(admin_token),
-        )
+        await post_absence(client, admin_token, emp_id, type="sick", end_date="2025-09-01", days_count=1)
 
     resp = await client.get(ABSENCES_URL, headers=auth_headers(employee_token))
     assert resp.status_code == 200
@@ -129,22 +121,12 @@ async def test_list_absences_employee_sees_only_own(client, admin_token, employe
 
 
 @pytest.mark.asyncio
-async def test_list_absences_admin_status_filter(client, admin_token, admin_user, db, tenant):
+async def test_list_absences_admin_status_filter(client, admin_token, admin_user, db, tenant, make_employee):
     """Admin kann nach status=pending filtern."""
-    emp = await create_employee_record(db, tenant)
+    emp = await make_employee()
 
     # pending Antrag
-    await client.post(
-        ABSENCES_URL,
-        json={
-            "employee_id": str(emp.id),
-            "type": "vacation",
-            "start_date": "2025-09-01",
-            "end_date": "2025-09-02",
-            "days_count": 2,
-        },
-        headers=auth_headers(admin_token),
-    )
+    await post_absence(client, admin_token, emp.id)
 
     resp = await client.get(
         ABSENCES_URL,
@@ -158,80 +140,39 @@ async def test_list_absences_admin_status_filter(client, admin_token, admin_user
 # ── PUT /absences/{id} – Genehmigung ─────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_approve_absence(client, admin_token, admin_user, db, tenant):
-    emp = await create_employee_record(db, tenant)
+async def test_approve_absence(client, admin_token, admin_user, db, tenant, make_employee):
+    emp = await make_employee()
 
-    create_resp = await client.post(
-        ABSENCES_URL,
-        json={
-            "employee_id": str(emp.id),
-            "type": "vacation",
-            "start_date": "2025-09-01",
-            "end_date": "2025-09-02",
-            "days_count": 2,
-        },
-        headers=auth_headers(admin_token),
-    )
-    absence_id = create_resp.json()["id"]
+    absence_id = (await post_absence(client, admin_token, emp.id)).json()["id"]
 
-    resp = await client.put(
-        f"{ABSENCES_URL}/{absence_id}",
-        json={"status": "approved"},
-        headers=auth_headers(admin_token),
-    )
+    resp = await set_absence_status(client, admin_token, absence_id, "approved")
     assert resp.status_code == 200
     assert resp.json()["status"] == "approved"
     assert resp.json()["approved_by"] is not None
 
 
 @pytest.mark.asyncio
-async def test_reject_absence(client, admin_token, admin_user, db, tenant):
-    emp = await create_employee_record(db, tenant)
+async def test_reject_absence(client, admin_token, admin_user, db, tenant, make_employee):
+    emp = await make_employee()
 
-    create_resp = await client.post(
-        ABSENCES_URL,
-        json={
-            "employee_id": str(emp.id),
-            "type": "vacation",
-            "start_date": "2025-09-05",
-            "end_date": "2025-09-05",
-            "days_count": 1,
-        },
-        headers=auth_headers(admin_token),
-    )
-    absence_id = create_resp.json()["id"]
+    absence_id = (await post_absence(
+        client, admin_token, emp.id, start_date="2025-09-05", end_date="2025-09-05", days_count=1,
+    )).json()["id"]
 
-    resp = await client.put(
-        f"{ABSENCES_URL}/{absence_id}",
-        json={"status": "rejected"},
-        headers=auth_headers(admin_token),
-    )
+    resp = await set_absence_status(client, admin_token, absence_id, "rejected")
     assert resp.status_code == 200
     assert resp.json()["status"] == "rejected"
 
 
 @pytest.mark.asyncio
 async def test_approve_absence_employee_forbidden(client, admin_token, employee_token,
-                                                   admin_user, employee_user, db, tenant):
+                                                   admin_user, employee_user, db, tenant, make_employee):
     """Employee-Rolle kann keinen Antrag genehmigen."""
-    emp = await create_employee_record(db, tenant)
+    emp = await make_employee()
 
-    create_resp = await client.post(
-        ABSENCES_URL,
-        json={
-            "employee_id": str(emp.id),
-            "type": "vacation",
-            "start_date": "2025-09-08",
-            "end_date": "2025-09-08",
-            "days_count": 1,
-        },
-        headers=auth_headers(admin_token),
-    )
-    absence_id = create_resp.json()["id"]
+    absence_id = (await post_absence(
+        client, admin_token, emp.id, start_date="2025-09-08", end_date="2025-09-08", days_count=1,
+    )).json()["id"]
 
-    resp = await client.put(
-        f"{ABSENCES_URL}/{absence_id}",
-        json={"status": "approved"},
-        headers=auth_headers(employee_token),
-    )
+    resp = await set_absence_status(client, employee_token, absence_id, "approved")
     assert resp.status_code == 403
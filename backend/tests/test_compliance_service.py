@@ -9,8 +9,11 @@ from types import SimpleNamespace
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import insert
 
-from app.services.compliance_service import ComplianceService
+from app.models.employee import Employee
+from app.models.shift import Shift
+from app.services.compliance_service import ComplianceResult, ComplianceService
 from tests.conftest import auth_headers
 
 
@@ -44,170 +47,107 @@ def make_employee(contract_type: str = "full_time"):
     )
 
 
-# ── §4 Pausenpflicht (_check_break) ──────────────────────────────────────────
+# Gemeinsame Spalten der DB-Mitarbeiter; Zeilen per Core-insert (ohne ORM-Flush)
+_EMPLOYEE_ROW = {
+    "contract_type": "full_time",
+    "hourly_rate": 14.0,
+    "annual_salary_limit": 0,
+    "vacation_days": 30,
+}
 
-@pytest.mark.asyncio
-async def test_break_under_6h_no_pause_required(db):
-    """5h Schicht ohne Pause → kein Verstoß."""
-    svc = ComplianceService(db)
-    shift = make_shift(date(2025, 9, 1), "08:00", "13:00", break_minutes=0)
-    from app.services.compliance_service import ComplianceResult
-    result = ComplianceResult()
-    svc._check_break(shift, result)
-    assert result.is_ok
 
+def employee_row(tenant_id, **fields) -> dict:
+    return {"id": uuid.uuid4(), "tenant_id": tenant_id, **_EMPLOYEE_ROW, **fields}
 
-@pytest.mark.asyncio
-async def test_break_over_6h_with_30min_ok(db):
-    """6.5h Schicht mit 30min Pause → kein Verstoß."""
-    svc = ComplianceService(db)
-    shift = make_shift(date(2025, 9, 1), "08:00", "14:30", break_minutes=30)
-    from app.services.compliance_service import ComplianceResult
-    result = ComplianceResult()
-    svc._check_break(shift, result)
-    assert result.is_ok
 
-
-@pytest.mark.asyncio
-async def test_break_over_6h_with_20min_violation(db):
-    """6.5h Schicht mit nur 20min Pause → §4-Verstoß."""
-    svc = ComplianceService(db)
-    shift = make_shift(date(2025, 9, 1), "08:00", "14:30", break_minutes=20)
-    from app.services.compliance_service import ComplianceResult
-    result = ComplianceResult()
-    svc._check_break(shift, result)
-    assert not result.is_ok
-    assert any("6h" in v for v in result.violations)
+@pytest.fixture
+def svc(db) -> ComplianceService:
+    return ComplianceService(db)
 
 
-@pytest.mark.asyncio
-async def test_break_over_9h_with_45min_ok(db):
-    """9.5h Schicht mit 45min Pause → kein Verstoß."""
-    svc = ComplianceService(db)
-    shift = make_shift(date(2025, 9, 1), "07:00", "16:30", break_minutes=45)
-    from app.services.compliance_service import ComplianceResult
-    result = ComplianceResult()
-    svc._check_break(shift, result)
-    assert result.is_ok
-
+# ── §4 Pausenpflicht (_check_break) ──────────────────────────────────────────
 
-@pytest.mark.asyncio
-async def test_break_over_9h_with_30min_violation(db):
-    """9.5h Schicht mit nur 30min Pause → §4-Verstoß (mind. 45min erforderlich)."""
-    svc = ComplianceService(db)
-    shift = make_shift(date(2025, 9, 1), "07:00", "16:30", break_minutes=30)
-    from app.services.compliance_service import ComplianceResult
+@pytest.mark.parametrize("start, end, break_minutes, violation", [
+    ("08:00", "13:00", 0, None),    # 5h ohne Pause → OK
+    ("08:00", "14:30", 30, None),   # 6.5h mit 30min → OK
+    ("08:00", "14:30", 20, "6h"),   # 6.5h mit nur 20min → §4-Verstoß
+    ("07:00", "16:30", 45, None),   # 9.5h mit 45min → OK
+    ("07:00", "16:30", 30, "9h"),   # 9.5h mit nur 30min → §4-Verstoß (mind. 45min)
+])
+@pytest.mark.fast
+def test_check_break(start, end, break_minutes, violation):
+    """§4 Pausenpflicht – reine Berechnung, daher ohne DB-Session."""
+    shift = make_shift(date(2025, 9, 1), start, end, break_minutes=break_minutes)
     result = ComplianceResult()
-    svc._check_break(shift, result)
-    assert not result.is_ok
-    assert any("9h" in v for v in result.violations)
+    ComplianceService(db=None)._check_break(shift, result)
+    if violation is None:
+        assert result.is_ok
+    else:
+        assert not result.is_ok
+        assert any(violation in v for v in result.violations)
 
 
 # ── §5 Ruhezeit (_check_rest_period) ─────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_rest_first_shift_no_violation(client, db, admin_token, tenant, admin_user):
+async def test_rest_first_shift_no_violation(client, db, admin_token, tenant, admin_user, svc):
     """Erste Schicht des Mitarbeiters (kein Vorgänger) → kein Verstoß."""
-    from app.models.employee import Employee
-    from app.core.security import hash_password
-
-    emp = Employee(
-        tenant_id=tenant.id,
-        first_name="Test",
-        last_name="User",
-        contract_type="full_time",
-        hourly_rate=14.0,
-        annual_salary_limit=0,
-        vacation_days=30,
-    )
-    db.add(emp)
+    emp = employee_row(tenant.id, first_name="Test", last_name="User")
+    await db.execute(insert(Employee).values(emp))
     await db.commit()
-    await db.refresh(emp)
 
-    shift = make_shift(date(2025, 9, 1), "08:00", "16:00", employee_id=emp.id)
-    employee = SimpleNamespace(id=emp.id, contract_type="full_time")
+    shift = make_shift(date(2025, 9, 1), "08:00", "16:00", employee_id=emp["id"])
+    employee = SimpleNamespace(id=emp["id"], contract_type="full_time")
 
-    svc = ComplianceService(db)
     result = await svc.check_shift(shift, employee)
     # Keine Ruhezeit-Verletzung (kein Vorgänger)
     assert not any("Ruhezeit" in v for v in result.violations)
 
 
 @pytest.mark.asyncio
-async def test_rest_14h_gap_ok(client, db, admin_token, tenant, admin_user):
+async def test_rest_14h_gap_ok(client, db, admin_token, tenant, admin_user, svc):
     """Vorschicht endet 20:00, neue Schicht 10:00 nächsten Tag → 14h Pause → OK."""
-    from app.models.employee import Employee
-    from app.models.shift import Shift
-
-    emp = Employee(
-        tenant_id=tenant.id,
-        first_name="Rest",
-        last_name="Test",
-        contract_type="full_time",
-        hourly_rate=14.0,
-        annual_salary_limit=0,
-        vacation_days=30,
-    )
-    db.add(emp)
-    await db.commit()
-    await db.refresh(emp)
-
+    emp = employee_row(tenant.id, first_name="Rest", last_name="Test")
+    await db.execute(insert(Employee).values(emp))
     # Vorgänger-Schicht
-    prev = Shift(
+    await db.execute(insert(Shift).values(
         tenant_id=tenant.id,
-        employee_id=emp.id,
+        employee_id=emp["id"],
         date=date(2025, 9, 1),
         start_time=time(12, 0),
         end_time=time(20, 0),
         break_minutes=0,
         status="confirmed",
-    )
-    db.add(prev)
+    ))
     await db.commit()
 
-    current_shift = make_shift(date(2025, 9, 2), "10:00", "18:00", employee_id=emp.id)
-    employee = SimpleNamespace(id=emp.id, contract_type="full_time")
+    current_shift = make_shift(date(2025, 9, 2), "10:00", "18:00", employee_id=emp["id"])
+    employee = SimpleNamespace(id=emp["id"], contract_type="full_time")
 
-    svc = ComplianceService(db)
     result = await svc.check_shift(current_shift, employee)
     assert not any("Ruhezeit" in v for v in result.violations)
 
 
 @pytest.mark.asyncio
-async def test_rest_10h_gap_violation(client, db, admin_token, tenant, admin_user):
+async def test_rest_10h_gap_violation(client, db, admin_token, tenant, admin_user, svc):
     """Vorschicht endet 23:00, neue Schicht 09:00 nächsten Tag → 10h Pause → Verstoß."""
-    from app.models.employee import Employee
-    from app.models.shift import Shift
-
-    emp = Employee(
-        tenant_id=tenant.id,
-        first_name="Rest",
-        last_name="Violation",
-        contract_type="full_time",
-        hourly_rate=14.0,
-        annual_salary_limit=0,
-        vacation_days=30,
-    )
-    db.add(emp)
-    await db.commit()
-    await db.refresh(emp)
-
-    prev = Shift(
+    emp = employee_row(tenant.id, first_name="Rest", last_name="Violation")
+    await db.execute(insert(Employee).values(emp))
+    # Vorgänger-Schicht
+    await db.execute(insert(Shift).values(
         tenant_id=tenant.id,
-        employee_id=emp.id,
+        employee_id=emp["id"],
         date=date(2025, 9, 1),
         start_time=time(15, 0),
         end_time=time(23, 0),
         break_minutes=0,
         status="confirmed",
-    )
-    db.add(prev)
+    ))
     await db.commit()
 
-    current_shift = make_shift(date(2025, 9, 2), "09:00", "17:00", employee_id=emp.id)
-    employee = SimpleNamespace(id=emp.id, contract_type="full_time")
+    current_shift = make_shift(date(2025, 9, 2), "09:00", "17:00", employee_id=emp["id"])
+    employee = SimpleNamespace(id=emp["id"], contract_type="full_time")
 
-    svc = ComplianceService(db)
     result = await svc.check_shift(current_shift, employee)
     assert not result.is_ok
     assert any("Ruhezeit" in v for v in result.violations)
@@ -216,9 +156,8 @@ async def test_rest_10h_gap_violation(client, db, admin_token, tenant, admin_use
 # ── Feiertags-Warning ─────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_holiday_warning(db):
+async def test_holiday_warning(svc):
     """Schicht am BW-Feiertag (Allerheiligen 1.11.) → Warning."""
-    svc = ComplianceService(db)
     emp_id = uuid.uuid4()
     shift = make_shift(date(2025, 11, 1), "08:00", "14:00",
                        break_minutes=0, employee_id=emp_id)
@@ -232,7 +171,7 @@ async def test_holiday_warning(db):
 # ── ContractHistory reads (DEBT-01) ───────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_compliance_reads_contract_history(db, tenant):
+async def test_compliance_reads_contract_history(db, tenant, svc):
     """Minijob-Check liest contract_type aus ContractHistory, nicht employee.contract_type."""
     from app.models.employee import Employee
     from app.models.contract_history import ContractHistory
@@ -291,7 +230,6 @@ async def test_compliance_reads_contract_history(db, tenant):
         contract_type="part_time",  # Spiegel-Feld falsch — darf nicht genutzt werden
     )
 
-    svc = ComplianceService(db)
     result = await svc.check_shift(shift, employee)
 
     # Minijob-Warning muss aufgetaucht sein (beweist CH-Lese, nicht Spiegel-Feld)
@@ -302,32 +240,22 @@ async def test_compliance_reads_contract_history(db, tenant):
 
 
 @pytest.mark.asyncio
-async def test_compliance_no_contract_warning(db, tenant):
+async def test_compliance_no_contract_warning(db, tenant, svc):
     """Employee ohne ContractHistory → Warning 'Kein gueltiger Vertrag', kein Absturz."""
-    from app.models.employee import Employee
-
-    emp = Employee(
-        tenant_id=tenant.id,
-        first_name="Kein",
-        last_name="Vertrag",
-        contract_type="minijob",
-        hourly_rate=14.0,
-        annual_salary_limit=0,
-        vacation_days=0,
+    emp = employee_row(
+        tenant.id, first_name="Kein", last_name="Vertrag", contract_type="minijob", vacation_days=0,
     )
-    db.add(emp)
+    await db.execute(insert(Employee).values(emp))
     await db.commit()
-    await db.refresh(emp)
 
-    shift = make_shift(date(2025, 9, 15), "08:00", "16:00", employee_id=emp.id)
+    shift = make_shift(date(2025, 9, 15), "08:00", "16:00", employee_id=emp["id"])
     employee = SimpleNamespace(
-        id=emp.id,
-        first_name=emp.first_name,
-        last_name=emp.last_name,
+        id=emp["id"],
+        first_name=emp["first_name"],
+        last_name=emp["last_name"],
         contract_type="minijob",
     )
 
-    svc = ComplianceService(db)
     result = await svc.check_shift(shift, employee)
 
     # Kein Absturz, aber Warning vorhanden
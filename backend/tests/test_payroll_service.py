@@ -9,6 +9,7 @@ from types import SimpleNamespace
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import insert
 
 from app.services.payroll_service import PayrollService, SURCHARGE_RATES
 
@@ -30,105 +31,58 @@ def make_shift(shift_date: date, start: str, end: str, break_minutes: int = 0, e
 
 # ── _calc_net_hours ───────────────────────────────────────────────────────────
 
-@pytest.mark.asyncio
-async def test_net_hours_normal_shift(db):
+# Reine Berechnung ohne DB-Zugriff → synchron, ohne db-Fixture
+
+@pytest.mark.fast
+def test_net_hours_normal_shift():
     """08:00–16:00 mit 30min Pause → 7.5h."""
-    svc = PayrollService(db)
     shift = make_shift(date(2025, 9, 1), "08:00", "16:00", break_minutes=30)
-    assert svc._calc_net_hours(shift) == pytest.approx(7.5)
+    assert PayrollService(db=None)._calc_net_hours(shift) == pytest.approx(7.5)
 
 
-@pytest.mark.asyncio
-async def test_net_hours_night_shift(db):
+@pytest.mark.fast
+def test_net_hours_night_shift():
     """23:00–07:00 ohne Pause → 8.0h (Mitternachtsübergang)."""
-    svc = PayrollService(db)
     shift = make_shift(date(2025, 9, 1), "23:00", "07:00", break_minutes=0)
-    assert svc._calc_net_hours(shift) == pytest.approx(8.0)
+    assert PayrollService(db=None)._calc_net_hours(shift) == 8.0
 
 
 # ── _calc_surcharges (§3b EStG) ───────────────────────────────────────────────
 
-@pytest.mark.asyncio
-async def test_surcharges_normal_day_none(db):
-    """Tagschicht Mo 09:00–17:00 → keine Zuschläge."""
-    svc = PayrollService(db)
-    shift = make_shift(date(2025, 9, 1), "09:00", "17:00")  # Montag
-    result = svc._calc_surcharges(shift, hourly_rate=14.0)
-    assert result["amounts"].get("early", 0) == pytest.approx(0)
-    assert result["amounts"].get("late", 0) == pytest.approx(0)
-    assert result["amounts"].get("night", 0) == pytest.approx(0)
-    assert result["amounts"].get("weekend", 0) == pytest.approx(0)
-    assert result["amounts"].get("sunday", 0) == pytest.approx(0)
-
-
-@pytest.mark.asyncio
-async def test_surcharges_early_shift(db):
-    """Frühschicht Mo 05:00–09:00 → 1h Frühzuschlag (05–06) + Nachtzuschlag (05–06)."""
-    svc = PayrollService(db)
-    shift = make_shift(date(2025, 9, 1), "05:00", "09:00")  # Montag
-    result = svc._calc_surcharges(shift, hourly_rate=10.0)
-    # 1 Stunde vor 06:00 → early 12.5% → 1 * 10 * 0.125 = 1.25
-    assert result["amounts"].get("early", 0) == pytest.approx(1.25)
-    assert result["hours"].get("early", 0) == pytest.approx(1.0)
-
-
-@pytest.mark.asyncio
-async def test_surcharges_late_shift(db):
-    """Spätschicht Mo 20:00–23:00 → 3h Spätzuschlag."""
-    svc = PayrollService(db)
-    shift = make_shift(date(2025, 9, 1), "20:00", "23:00")  # Montag
-    result = svc._calc_surcharges(shift, hourly_rate=10.0)
-    # 3h ab 20:00 → late 12.5% → 3 * 10 * 0.125 = 3.75
-    assert result["amounts"].get("late", 0) == pytest.approx(3.75)
-    assert result["hours"].get("late", 0) == pytest.approx(3.0)
-
-
-@pytest.mark.asyncio
-async def test_surcharges_night_shift(db):
-    """Nachtschicht Mo 23:00–03:00 → Nacht- + Frühzuschlag."""
-    svc = PayrollService(db)
-    shift = make_shift(date(2025, 9, 1), "23:00", "03:00")  # Mo→Di
-    result = svc._calc_surcharges(shift, hourly_rate=10.0)
-    # 4h Nacht (23–06): 1h Spät (23:00) + 4h Nacht gesamt
-    assert result["hours"].get("night", 0) == pytest.approx(4.0)
-    assert result["amounts"].get("night", 0) == pytest.approx(4 * 10 * 0.25)
-
-
-@pytest.mark.asyncio
-async def test_surcharges_saturday(db):
-    """Samstagsschicht 10:00–14:00 → 25% Wochenendzuschlag."""
-    svc = PayrollService(db)
-    shift = make_shift(date(2025, 9, 6), "10:00", "14:00")  # Samstag
-    result = svc._calc_surcharges(shift, hourly_rate=10.0)
-    # 4h * 10€ * 0.25 = 10€
-    assert result["amounts"].get("weekend", 0) == pytest.approx(10.0)
-    assert result["hours"].get("weekend", 0) == pytest.approx(4.0)
-
-
-@pytest.mark.asyncio
-async def test_surcharges_sunday(db):
-    """Sonntagsschicht 10:00–14:00 → 50% Sonntagszuschlag."""
-    svc = PayrollService(db)
-    shift = make_shift(date(2025, 9, 7), "10:00", "14:00")  # Sonntag
-    result = svc._calc_surcharges(shift, hourly_rate=10.0)
-    # 4h * 10€ * 0.50 = 20€
-    assert result["amounts"].get("sunday", 0) == pytest.approx(20.0)
-
-
-@pytest.mark.asyncio
-async def test_surcharges_holiday_bw(db):
-    """Feiertagsschicht Allerheiligen (BW) → 125% Feiertagszuschlag statt Wochentag."""
-    svc = PayrollService(db)
-    shift = make_shift(date(2025, 11, 1), "10:00", "14:00")  # Allerheiligen (Sa in 2025)
-    result = svc._calc_surcharges(shift, hourly_rate=10.0)
-    # 4h * 10€ * 1.25 = 50€; kein weekend-Zuschlag (holiday überschreibt)
-    assert result["amounts"].get("holiday", 0) == pytest.approx(50.0)
-    assert result["amounts"].get("weekend", 0) == pytest.approx(0)
+_NO_SURCHARGE = {"early": 0, "late": 0, "night": 0, "weekend": 0, "sunday": 0}
+
+
+@pytest.mark.parametrize("shift_date, start, end, hourly_rate, amounts, hours", [
+    # Tagschicht Mo 09:00–17:00 → keine Zuschläge
+    pytest.param(date(2025, 9, 1), "09:00", "17:00", 14.0, _NO_SURCHARGE, {}, id="normal_day_none"),
+    # Frühschicht Mo 05:00–09:00 → 1h vor 06:00, early 12.5% → 1 * 10 * 0.125
+    pytest.param(date(2025, 9, 1), "05:00", "09:00", 10.0, {"early": 1.25}, {"early": 1.0}, id="early_shift"),
+    # Spätschicht Mo 20:00–23:00 → 3h ab 20:00, late 12.5% → 3 * 10 * 0.125
+    pytest.param(date(2025, 9, 1), "20:00", "23:00", 10.0, {"late": 3.75}, {"late": 3.0}, id="late_shift"),
+    # Nachtschicht Mo→Di 23:00–03:00 → 4h Nacht (23–06) à 25%
+    pytest.param(date(2025, 9, 1), "23:00", "03:00", 10.0, {"night": 4 * 10 * 0.25}, {"night": 4.0}, id="night_shift"),
+    # Samstag 10:00–14:00 → 4h * 10€ * 0.25 Wochenendzuschlag
+    pytest.param(date(2025, 9, 6), "10:00", "14:00", 10.0, {"weekend": 10.0}, {"weekend": 4.0}, id="saturday"),
+    # Sonntag 10:00–14:00 → 4h * 10€ * 0.50 Sonntagszuschlag
+    pytest.param(date(2025, 9, 7), "10:00", "14:00", 10.0, {"sunday": 20.0}, {}, id="sunday"),
+    # Allerheiligen (BW, Sa in 2025) → 4h * 10€ * 1.25; Feiertag überschreibt weekend
+    pytest.param(date(2025, 11, 1), "10:00", "14:00", 10.0, {"holiday": 50.0, "weekend": 0}, {}, id="holiday_bw"),
+])
+@pytest.mark.fast
+def test_surcharges(shift_date, start, end, hourly_rate, amounts, hours):
+    """_calc_surcharges rechnet ohne DB – daher synchron und ohne db-Fixture."""
+    shift = make_shift(shift_date, start, end)
+    result = PayrollService(db=None)._calc_surcharges(shift, hourly_rate=hourly_rate)
+    for key, expected in amounts.items():
+        assert result["amounts"].get(key, 0) == pytest.approx(expected), key
+    for key, expected in hours.items():
+        assert result["hours"].get(key, 0) == pytest.approx(expected), key
 
 
 # ── calculate_monthly_payroll (Integration) ───────────────────────────────────
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_no_shifts(db, tenant):
     """Keine Schichten im Monat → actual_hours=0, base_wage=0."""
     from app.models.employee import Employee
@@ -145,7 +99,6 @@ async def test_payroll_no_shifts(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     ch = ContractHistory(
         tenant_id=tenant.id,
@@ -166,6 +119,7 @@ async def test_payroll_no_shifts(db, tenant):
 
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_simple_shift(db, tenant):
     """Eine Schicht 8h → base_wage = 8 * stundenlohn."""
     from app.models.employee import Employee
@@ -183,7 +137,6 @@ async def test_payroll_simple_shift(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     ch = ContractHistory(
         tenant_id=tenant.id,
@@ -209,11 +162,12 @@ async def test_payroll_simple_shift(db, tenant):
 
     svc = PayrollService(db)
     entry, _ = await svc.calculate_monthly_payroll(emp.id, date(2025, 9, 1))
-    assert entry.actual_hours == pytest.approx(8.0)
+    assert entry.actual_hours == 8.0
     assert entry.base_wage == pytest.approx(80.0)
 
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_planned_shift_not_counted(db, tenant):
     """Schicht mit status='planned' zählt NICHT für Abrechnung."""
     from app.models.employee import Employee
@@ -231,7 +185,6 @@ async def test_payroll_planned_shift_not_counted(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     ch = ContractHistory(
         tenant_id=tenant.id,
@@ -261,6 +214,7 @@ async def test_payroll_planned_shift_not_counted(db, tenant):
 
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_minijob_cap(db, tenant):
     """Stunden über Monatslimit → carryover_hours > 0, paid_hours == limit."""
     from app.models.employee import Employee
@@ -279,7 +233,6 @@ async def test_payroll_minijob_cap(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     ch = ContractHistory(
         tenant_id=tenant.id,
@@ -293,30 +246,32 @@ async def test_payroll_minijob_cap(db, tenant):
     )
     db.add(ch)
 
-    # 3 Schichten à 8h = 24h gesamt, Limit 20h → 4h Übertrag
-    for day in [1, 8, 15]:
-        shift = Shift(
-            tenant_id=tenant.id,
-            employee_id=emp.id,
-            date=date(2025, 9, day),
-            start_time=time(8, 0),
-            end_time=time(16, 0),
-            break_minutes=0,
-            status="confirmed",
-        )
-        db.add(shift)
+    # 3 Schichten à 8h = 24h gesamt, Limit 20h → 4h Übertrag (ein Bulk-INSERT)
+    await db.execute(insert(Shift), [
+        {
+            "tenant_id": tenant.id,
+            "employee_id": emp.id,
+            "date": date(2025, 9, day),
+            "start_time": time(8, 0),
+            "end_time": time(16, 0),
+            "break_minutes": 0,
+            "status": "confirmed",
+        }
+        for day in (1, 8, 15)
+    ])
     await db.commit()
 
     svc = PayrollService(db)
     entry, new_carryover = await svc.calculate_monthly_payroll(emp.id, date(2025, 9, 1))
-    assert entry.actual_hours == pytest.approx(24.0)
-    assert entry.paid_hours == pytest.approx(20.0)
-    assert new_carryover == pytest.approx(4.0)
+    assert entry.actual_hours == 24.0
+    assert entry.paid_hours == 20.0
+    assert new_carryover == 4.0
 
 
 # ── Monatslohn (monthly_salary) ───────────────────────────────────────────────
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_monthly_salary_base_wage_fixed(db, tenant):
     """Teilzeit mit Monatslohn: base_wage = monthly_salary, unabhängig von Stunden."""
     from app.models.employee import Employee
@@ -336,7 +291,6 @@ async def test_payroll_monthly_salary_base_wage_fixed(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     ch = ContractHistory(
         tenant_id=tenant.id,
@@ -370,10 +324,11 @@ async def test_payroll_monthly_salary_base_wage_fixed(db, tenant):
     # Grundlohn = Monatslohn, nicht Stunden * Stundensatz
     assert entry.base_wage == pytest.approx(1800.0, rel=0.01)
     # Stunden wurden trotzdem gezählt
-    assert entry.actual_hours == pytest.approx(60.0)
+    assert entry.actual_hours == 60.0
 
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_monthly_salary_surcharges_applied(db, tenant):
     """Bei Monatslohn werden Zuschläge über effektiven Stundensatz berechnet."""
     from app.models.employee import Employee
@@ -394,7 +349,6 @@ async def test_payroll_monthly_salary_surcharges_applied(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     ch = ContractHistory(
         tenant_id=tenant.id,
@@ -438,6 +392,7 @@ async def test_payroll_monthly_salary_surcharges_applied(db, tenant):
 # ── Jahressoll (annual_hours_target) ─────────────────────────────────────────
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_jahressoll_monthly_target(db, tenant):
     """Jahressoll-Mitarbeiter: monthly_hours_target = annual_hours_target / 12."""
     from app.models.employee import Employee
@@ -456,7 +411,6 @@ async def test_payroll_jahressoll_monthly_target(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     ch = ContractHistory(
         tenant_id=tenant.id,
@@ -479,6 +433,7 @@ async def test_payroll_jahressoll_monthly_target(db, tenant):
 
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_jahressoll_remaining_decreases(db, tenant):
     """annual_hours_remaining sinkt nach gearbeiteten Stunden."""
     from app.models.employee import Employee
@@ -499,7 +454,6 @@ async def test_payroll_jahressoll_remaining_decreases(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     ch = ContractHistory(
         tenant_id=tenant.id,
@@ -538,6 +492,7 @@ async def test_payroll_jahressoll_remaining_decreases(db, tenant):
 # ── Mehrfachverträge im selben Monat ──────────────────────────────────────────
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_multi_contract_split(db, tenant):
     """Wenn Stundenlohn mitten im Monat wechselt, werden Dienste korrekt aufgeteilt."""
     from app.models.employee import Employee
@@ -555,7 +510,6 @@ async def test_payroll_multi_contract_split(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     # Erster Vertrag: 1.–14. Sep, 10€/h
     c1 = ContractHistory(
@@ -608,12 +562,13 @@ async def test_payroll_multi_contract_split(db, tenant):
 
     # Gesamtlohn = 80 + 112 = 192€
     assert entry.base_wage == pytest.approx(192.0, rel=0.01)
-    assert entry.actual_hours == pytest.approx(16.0)
+    assert entry.actual_hours == 16.0
 
 
 # ── ContractHistory-only reads (DEBT-01) ─────────────────────────────────────
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_no_contract_soft_fail(db, tenant):
     """Employee ohne ContractHistory -> soft-fail: total_gross=0, Warning in notes."""
     from app.models.employee import Employee
@@ -629,21 +584,21 @@ async def test_payroll_no_contract_soft_fail(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     svc = PayrollService(db)
     entry, carryover = await svc.calculate_monthly_payroll(emp.id, date(2025, 9, 1))
 
     # Kein Absturz, total_gross = 0
-    assert entry.total_gross == pytest.approx(0.0)
-    assert entry.actual_hours == pytest.approx(0.0)
-    assert carryover == pytest.approx(0.0)
+    assert entry.total_gross == 0.0
+    assert entry.actual_hours == 0.0
+    assert carryover == 0.0
     # Warning-Text muss im notes-Feld stehen
     assert entry.notes is not None
     assert "Kein gueltiger Vertrag" in entry.notes
 
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_uses_contract_history_not_mirror(db, tenant):
     """Berechnung nutzt ContractHistory.hourly_rate, nicht employee.hourly_rate."""
     from app.models.employee import Employee
@@ -662,7 +617,6 @@ async def test_payroll_uses_contract_history_not_mirror(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     # ContractHistory.hourly_rate = 15.50€ (wahrer Wert)
     ch = ContractHistory(
@@ -696,6 +650,7 @@ async def test_payroll_uses_contract_history_not_mirror(db, tenant):
 
 
 @pytest.mark.asyncio
+@pytest.mark.integration
 async def test_payroll_no_monthly_salary_fallback_to_ch_rate(db, tenant):
     """Wenn ContractHistory kein monthly_salary hat, wird CH.hourly_rate genutzt (kein Employee-Fallback)."""
     from app.models.employee import Employee
@@ -714,7 +669,6 @@ async def test_payroll_no_monthly_salary_fallback_to_ch_rate(db, tenant):
     )
     db.add(emp)
     await db.commit()
-    await db.refresh(emp)
 
     # CH hat kein monthly_salary → Stundenlohn-Modus
     ch = ContractHistory(
@@ -2,6 +2,7 @@
 Tests für pdf_service.generate_payslip_pdf –
 Stellt sicher, dass der PDF-Dienst Vertragsdaten ausschließlich aus ContractHistory liest.
 """
+import re
 import uuid
 from datetime import date
 from decimal import Decimal
@@ -228,3 +229,66 @@ def test_minijob_block_controlled_by_ch_contract_type():
     pdf_bytes = generate_payslip_pdf(entry, employee, "Test GmbH", contract=contract)
     assert isinstance(pdf_bytes, bytes)
     assert len(pdf_bytes) > 100
+
+
+# ── Test: Monat ohne Tätigkeit → kompakter Lohnzettel ────────────────────────
+
+def _empty_month_entry(**overrides):
+    fields = dict(
+        planned_hours=None,
+        actual_hours=None,
+        paid_hours=None,
+        base_wage=Decimal("0"),
+        total_gross=Decimal("0"),
+    )
+    return make_payroll_entry(**{**fields, **overrides})
+
+
+def test_empty_month_payslip_uses_compact_layout():
+    """Ohne Stunden/Vergütung wird der Kurz-Lohnzettel gebaut."""
+    from app.services import pdf_service
+
+    employee = make_employee()
+    contract = make_contract(contract_type="minijob")
+
+    with patch.object(pdf_service, "_render_empty_payslip", wraps=pdf_service._render_empty_payslip) as compact:
+        pdf_bytes = pdf_service.generate_payslip_pdf(_empty_month_entry(), employee, "Test GmbH", contract=contract)
+
+    assert pdf_bytes.startswith(b"%PDF")
+    compact.assert_called_once()
+
+
+@pytest.mark.parametrize("overrides", [
+    {"planned_hours": Decimal("20.00")},
+    {"carryover_hours": Decimal("-3.50")},
+], ids=["planned_hours", "carryover_hours"])
+def test_month_with_planned_or_carryover_hours_keeps_hours_table(overrides):
+    """Soll-Stunden oder Übertrag ohne geleistete Arbeit dürfen nicht im Kurz-Lohnzettel verschwinden."""
+    from app.services import pdf_service
+
+    employee = make_employee()
+    contract = make_contract(contract_type="minijob")
+
+    with patch.object(pdf_service, "_render_empty_payslip") as compact:
+        pdf_bytes = pdf_service.generate_payslip_pdf(
+            _empty_month_entry(**overrides), employee, "Test GmbH", contract=contract,
+        )
+
+    assert pdf_bytes.startswith(b"%PDF")
+    compact.assert_not_called()
+
+
+# ── Test: lange Notizen laufen auf Folgeseiten weiter ────────────────────────
+
+def test_long_notes_are_split_across_pages():
+    """Eine Notiz, die höher als eine ganze Seite ist, wird geteilt statt einen Fehler zu werfen."""
+    from app.services.pdf_service import generate_payslip_pdf
+
+    entry = make_payroll_entry(notes=" ".join(["Lange Notiz zum Abrechnungsmonat."] * 1500))
+    employee = make_employee()
+    contract = make_contract(contract_type="part_time")
+
+    pdf_bytes = generate_payslip_pdf(entry, employee, "Test GmbH", contract=contract)
+
+    assert pdf_bytes.startswith(b"%PDF")
+    assert len(re.findall(rb"/Type /Page\b(?!s)", pdf_bytes)) >= 3
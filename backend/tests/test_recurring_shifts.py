@@ -8,12 +8,17 @@ API tests for:
   GET  /api/v1/calendar/vacation-data
 """
 import uuid
+from datetime import date, datetime, time, timezone
+
 import pytest
-from sqlalchemy import select
+import pytest_asyncio
+from sqlalchemy import event, func, select, update
 
 from tests.conftest import auth_headers
+from app.models.recurring_shift import RecurringShift
 from app.models.shift import Shift
-from app.models.holiday_profile import HolidayProfile, VacationPeriod
+from app.models.holiday_profile import CustomHoliday, HolidayProfile, VacationPeriod
+from app.services.recurring_shift_service import insert_generated_shifts
 
 RS_BASE = "/api/v1/recurring-shifts"
 HP_BASE = "/api/v1/holiday-profiles"
@@ -33,6 +38,25 @@ async def _create_profile_with_summer(client, token) -> str:
     return pid
 
 
+async def _count_shifts(db, rs_id: uuid.UUID) -> int:
+    """Number of Shift rows generated for a RecurringShift (COUNT(*) instead of loading them)."""
+    return (await db.execute(
+        select(func.count()).select_from(Shift).where(Shift.recurring_shift_id == rs_id)
+    )).scalar_one()
+
+
+async def _confirm_shift(db, rs_id: uuid.UUID, shift_date: date) -> uuid.UUID:
+    """Sets one generated shift to confirmed (single UPDATE … RETURNING) and returns its ID."""
+    shift_id = (await db.execute(
+        update(Shift)
+        .where(Shift.recurring_shift_id == rs_id, Shift.date == shift_date)
+        .values(status="confirmed")
+        .returning(Shift.id)
+    )).scalar_one()
+    await db.commit()
+    return shift_id
+
+
 def _monday_payload(valid_from="2025-09-01", valid_until="2025-09-30", profile_id=None) -> dict:
     return {
         "weekday": 0,           # Monday
@@ -46,6 +70,55 @@ def _monday_payload(valid_from="2025-09-01", valid_until="2025-09-30", profile_i
     }
 
 
+@pytest.fixture
+def make_recurring_shift(db, tenant, admin_user):
+    """
+    Factory: seed a RecurringShift (Mondays 1.–30.9.2025, like _monday_payload)
+    plus its generated shifts directly via the service – no HTTP round-trip.
+    Returns the id as UUID (interpolates into URLs like the string form).
+    """
+    async def _make(**overrides) -> uuid.UUID:
+        rs = RecurringShift(**{
+            "id": uuid.uuid4(),
+            "tenant_id": tenant.id,
+            "weekday": 0,
+            "start_time": time(8, 0),
+            "end_time": time(13, 0),
+            "break_minutes": 30,
+            "valid_from": date(2025, 9, 1),
+            "valid_until": date(2025, 9, 30),
+            "skip_public_holidays": True,
+            "created_by": admin_user.id,
+            "created_at": datetime.now(timezone.utc),
+            **overrides,
+        })
+        db.add(rs)
+        await insert_generated_shifts(rs, rs.valid_from, rs.valid_until, profile=None, db=db)
+        await db.commit()
+        # Nicht in der Identity-Map behalten – spätere SELECTs sollen den Stand nach HTTP-Mutationen sehen
+        db.expunge(rs)
+        return rs.id
+
+    return _make
+
+
+@pytest_asyncio.fixture
+async def active_profile(db, tenant) -> str:
+    """
+    Active holiday profile with Herbstferien 2025 and one custom day (15.10.2025),
+    inserted directly – the vacation-data tests only read it.
+    """
+    pid = uuid.uuid4()
+    db.add_all([
+        HolidayProfile(id=pid, tenant_id=tenant.id, name="Test", is_active=True),
+        VacationPeriod(profile_id=pid, tenant_id=tenant.id, name="Herbstferien",
+                       start_date=date(2025, 10, 27), end_date=date(2025, 10, 31)),
+        CustomHoliday(profile_id=pid, tenant_id=tenant.id, name="Konferenztag", date=date(2025, 10, 15)),
+    ])
+    await db.commit()
+    return str(pid)
+
+
 # ── Preview ───────────────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
@@ -75,6 +148,32 @@ async def test_preview_with_vacation(client, admin_token):
     assert data["generated_count"] == 3
 
 
+@pytest.mark.asyncio
+async def test_preview_loads_profile_in_three_queries(client, admin_token, engine, active_profile):
+    """Active profile plus its periods/custom days are loaded eagerly: 1 profile SELECT + 2 selectin."""
+    profile_tables = ("holiday_profiles", "vacation_periods", "custom_holidays")
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if any(t in statement for t in profile_tables):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        resp = await client.post(
+            RS_BASE + "/preview",
+            json=_monday_payload(valid_from="2025-10-01", valid_until="2025-10-31"),
+            headers=auth_headers(admin_token),
+        )
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+    assert resp.status_code == 200
+    # 27.10. falls into Herbstferien
+    assert resp.json()["skipped_count"] == 1
+    assert len(statements) <= 3
+
+
 @pytest.mark.asyncio
 async def test_preview_requires_auth(client):
     resp = await client.post(RS_BASE + "/preview", json=_monday_payload())
@@ -115,9 +214,7 @@ async def test_create_with_profile_skips_vacation(client, admin_token, db):
     assert data["skipped_count"] == 2
     assert data["generated_count"] == 3
 
-    rs_id = uuid.UUID(data["recurring_shift"]["id"])
-    result = await db.execute(select(Shift).where(Shift.recurring_shift_id == rs_id))
-    assert len(result.scalars().all()) == 3
+    assert await _count_shifts(db, uuid.UUID(data["recurring_shift"]["id"])) == 3
 
 
 @pytest.mark.asyncio
@@ -128,8 +225,9 @@ async def test_create_shift_times_are_correct(client, admin_token, db):
         headers=auth_headers(admin_token),
     )
     rs_id = uuid.UUID(resp.json()["recurring_shift"]["id"])
-    result = await db.execute(select(Shift).where(Shift.recurring_shift_id == rs_id))
-    shift = result.scalars().first()
+    shift = await db.scalar(
+        select(Shift).where(Shift.recurring_shift_id == rs_id).order_by(Shift.date).limit(1)
+    )
     assert str(shift.start_time)[:5] == "09:00"
     assert str(shift.end_time)[:5] == "14:30"
     assert shift.break_minutes == 45
@@ -144,17 +242,17 @@ async def test_create_requires_manager_or_admin(client, employee_token):
 # ── List ──────────────────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_list_recurring_shifts(client, admin_token):
-    await client.post(RS_BASE, json=_monday_payload(), headers=auth_headers(admin_token))
-    await client.post(RS_BASE, json={**_monday_payload(), "weekday": 2}, headers=auth_headers(admin_token))  # Wed
+async def test_list_recurring_shifts(client, admin_token, make_recurring_shift):
+    await make_recurring_shift()
+    await make_recurring_shift(weekday=2)  # Wed
     resp = await client.get(RS_BASE, headers=auth_headers(admin_token))
     assert resp.status_code == 200
     assert len(resp.json()) == 2
 
 
 @pytest.mark.asyncio
-async def test_list_includes_weekday_name(client, admin_token):
-    await client.post(RS_BASE, json=_monday_payload(), headers=auth_headers(admin_token))
+async def test_list_includes_weekday_name(client, admin_token, make_recurring_shift):
+    await make_recurring_shift()
     resp = await client.get(RS_BASE, headers=auth_headers(admin_token))
     assert resp.json()[0]["weekday_name"] == "Montag"
 
@@ -162,21 +260,12 @@ async def test_list_includes_weekday_name(client, admin_token):
 # ── Update from Date ──────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_update_from_preserves_confirmed_shifts(client, admin_token, db):
+async def test_update_from_preserves_confirmed_shifts(client, admin_token, db, make_recurring_shift):
     """Confirmed shifts are NOT deleted when update-from is called."""
-    resp = await client.post(RS_BASE, json=_monday_payload(), headers=auth_headers(admin_token))
-    rs_id = resp.json()["recurring_shift"]["id"]
+    rs_id = await make_recurring_shift()
 
     # Manually confirm the first shift (1.9.2025)
-    result = await db.execute(
-        select(Shift)
-        .where(Shift.recurring_shift_id == uuid.UUID(rs_id))
-        .order_by(Shift.date)
-    )
-    shifts = result.scalars().all()
-    first_shift = shifts[0]
-    first_shift.status = "confirmed"
-    await db.commit()
+    first_shift_id = await _confirm_shift(db, rs_id, date(2025, 9, 1))
 
     # Update from 2.9.2025 – should not touch the confirmed 1.9.2025
     resp2 = await client.post(
@@ -188,7 +277,7 @@ async def test_update_from_preserves_confirmed_shifts(client, admin_token, db):
 
     # Confirmed shift still exists
     check = await db.execute(
-        select(Shift).where(Shift.id == first_shift.id)
+        select(Shift).where(Shift.id == first_shift_id)
     )
     confirmed = check.scalar_one_or_none()
     assert confirmed is not None
@@ -196,16 +285,12 @@ async def test_update_from_preserves_confirmed_shifts(client, admin_token, db):
 
 
 @pytest.mark.asyncio
-async def test_update_from_deletes_future_planned(client, admin_token, db):
+async def test_update_from_deletes_future_planned(client, admin_token, db, make_recurring_shift):
     """Planned future shifts are deleted and regenerated by update-from."""
-    resp = await client.post(RS_BASE, json=_monday_payload(), headers=auth_headers(admin_token))
-    rs_id = resp.json()["recurring_shift"]["id"]
+    rs_id = await make_recurring_shift()
 
     # Before: 5 planned shifts
-    result = await db.execute(
-        select(Shift).where(Shift.recurring_shift_id == uuid.UUID(rs_id))
-    )
-    assert len(result.scalars().all()) == 5
+    assert await _count_shifts(db, rs_id) == 5
 
     # Update-from 2nd Monday (8.9), regenerating from there
     resp2 = await client.post(
@@ -217,68 +302,53 @@ async def test_update_from_deletes_future_planned(client, admin_token, db):
     # 4 Mondays from 8.9 to 29.9 (8, 15, 22, 29) regenerated
     assert resp2.json()["generated_count"] == 4
 
-    result2 = await db.execute(
-        select(Shift).where(Shift.recurring_shift_id == uuid.UUID(rs_id))
-    )
     # 1.9 (kept: was before from_date) + 4 new = 5 total
-    assert len(result2.scalars().all()) == 5
+    assert await _count_shifts(db, rs_id) == 5
 
 
 # ── Delete ────────────────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
-async def test_delete_soft_deletes_and_removes_future_planned(client, admin_token, db):
-    resp = await client.post(RS_BASE, json=_monday_payload(), headers=auth_headers(admin_token))
-    rs_id = resp.json()["recurring_shift"]["id"]
+async def test_delete_soft_deletes_and_removes_future_planned(client, admin_token, db, make_recurring_shift):
+    rs_id = await make_recurring_shift()
 
     del_resp = await client.delete(f"{RS_BASE}/{rs_id}", headers=auth_headers(admin_token))
     assert del_resp.status_code == 204
 
     # RecurringShift is soft-deleted (is_active=False), not gone from DB
-    from app.models.recurring_shift import RecurringShift
     result = await db.execute(
-        select(RecurringShift).where(RecurringShift.id == uuid.UUID(rs_id))
+        select(RecurringShift).where(RecurringShift.id == rs_id)
     )
     rs = result.scalar_one_or_none()
     assert rs is not None
     assert rs.is_active is False
 
     # All planned shifts are removed
-    shifts_result = await db.execute(
-        select(Shift).where(Shift.recurring_shift_id == uuid.UUID(rs_id))
-    )
-    assert len(shifts_result.scalars().all()) == 0
+    assert await _count_shifts(db, rs_id) == 0
 
 
 @pytest.mark.asyncio
-async def test_delete_preserves_confirmed_shifts(client, admin_token, db):
-    resp = await client.post(RS_BASE, json=_monday_payload(), headers=auth_headers(admin_token))
-    rs_id = resp.json()["recurring_shift"]["id"]
+async def test_delete_preserves_confirmed_shifts(client, admin_token, db, make_recurring_shift):
+    rs_id = await make_recurring_shift()
 
     # Confirm the first shift
-    result = await db.execute(
-        select(Shift).where(Shift.recurring_shift_id == uuid.UUID(rs_id)).order_by(Shift.date)
-    )
-    first = result.scalars().first()
-    first.status = "confirmed"
-    await db.commit()
+    first_id = await _confirm_shift(db, rs_id, date(2025, 9, 1))
 
     await client.delete(f"{RS_BASE}/{rs_id}", headers=auth_headers(admin_token))
 
     # Confirmed shift remains
-    check = await db.execute(select(Shift).where(Shift.id == first.id))
+    check = await db.execute(select(Shift).where(Shift.id == first_id))
     assert check.scalar_one_or_none() is not None
 
 
 @pytest.mark.asyncio
-async def test_deleted_rs_not_in_list(client, admin_token):
-    resp = await client.post(RS_BASE, json=_monday_payload(), headers=auth_headers(admin_token))
-    rs_id = resp.json()["recurring_shift"]["id"]
+async def test_deleted_rs_not_in_list(client, admin_token, make_recurring_shift):
+    rs_id = await make_recurring_shift()
     await client.delete(f"{RS_BASE}/{rs_id}", headers=auth_headers(admin_token))
 
     list_resp = await client.get(RS_BASE, headers=auth_headers(admin_token))
     ids = [rs["id"] for rs in list_resp.json()]
-    assert rs_id not in ids
+    assert str(rs_id) not in ids
 
 
 # ── Calendar vacation-data ────────────────────────────────────────────────────
@@ -300,15 +370,8 @@ async def test_vacation_data_no_profile(client, admin_token):
 
 
 @pytest.mark.asyncio
-async def test_vacation_data_with_active_profile(client, admin_token):
+async def test_vacation_data_with_active_profile(client, admin_token, active_profile):
     """Vacation periods from the active profile are returned."""
-    r = await client.post(
-        HP_BASE,
-        json={"name": "Test", "is_active": True, "preset_bw": True},
-        headers=auth_headers(admin_token),
-    )
-    assert r.status_code == 201
-
     resp = await client.get(
         "/api/v1/calendar/vacation-data",
         params={"from": "2025-10-01", "to": "2025-11-30"},
@@ -344,15 +407,8 @@ async def test_vacation_data_requires_auth(client):
 
 
 @pytest.mark.asyncio
-async def test_vacation_data_custom_holidays_included(client, admin_token):
+async def test_vacation_data_custom_holidays_included(client, admin_token, active_profile):
     """Custom holidays from active profile appear in response."""
-    r = await client.post(HP_BASE, json={"name": "P", "is_active": True}, headers=auth_headers(admin_token))
-    pid = r.json()["id"]
-    await client.post(
-        f"{HP_BASE}/{pid}/custom-days",
-        json={"name": "Konferenztag", "date": "2025-10-15"},
-        headers=auth_headers(admin_token),
-    )
     resp = await client.get(
         "/api/v1/calendar/vacation-data",
         params={"from": "2025-10-01", "to": "2025-10-31"},
@@ -12,7 +12,8 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 from app.models.employee import Employee
 from app.models.shift import Shift
 from app.models.notification import NotificationLog
-from app.tasks.reminder_tasks import _do_send_reminder
+from app.tasks import reminder_tasks
+from app.tasks.reminder_tasks import _do_send_reminder, _do_send_reminders_batch
 
 
 @pytest.mark.asyncio
@@ -112,3 +113,98 @@ async def test_reminder_noop_for_shift_without_employee(monkeypatch, engine, db,
 
     log_result = await db.execute(select(NotificationLog))
     assert log_result.scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_reminder_batch_dispatches_per_shift(monkeypatch, engine, db, tenant):
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr("app.core.database.TaskSessionLocal", session_factory)
+
+    emp_on = Employee(
+        tenant_id=tenant.id,
+        first_name="Nina",
+        last_name="Test",
+        email="nina@test.de",
+        contract_type="minijob",
+        hourly_rate=13.0,
+        vacation_days=0,
+        is_active=True,
+        notification_prefs={"events": {"shift_reminder": True}},
+    )
+    emp_off = Employee(
+        tenant_id=tenant.id,
+        first_name="Olaf",
+        last_name="Test",
+        email="olaf@test.de",
+        contract_type="minijob",
+        hourly_rate=13.0,
+        vacation_days=0,
+        is_active=True,
+        notification_prefs={"events": {"shift_reminder": False}},
+    )
+    db.add_all([emp_on, emp_off])
+    await db.commit()
+
+    tomorrow = date.today() + timedelta(days=1)
+    shifts = [
+        Shift(tenant_id=tenant.id, employee_id=emp_on.id, date=tomorrow,
+              start_time=time(8, 0), end_time=time(12, 0)),
+        Shift(tenant_id=tenant.id, employee_id=emp_on.id, date=tomorrow,
+              start_time=time(14, 0), end_time=time(18, 0)),
+        Shift(tenant_id=tenant.id, employee_id=emp_off.id, date=tomorrow,
+              start_time=time(9, 0), end_time=time(17, 0)),
+    ]
+    db.add_all(shifts)
+    await db.commit()
+
+    await _do_send_reminders_batch([str(s.id) for s in shifts], hours_before=24)
+
+    log_result = await db.execute(select(NotificationLog).where(NotificationLog.event_type == "shift_reminder"))
+    logs = log_result.scalars().all()
+    assert len(logs) == 2
+    assert {log.employee_id for log in logs} == {emp_on.id}
+
+
+@pytest.mark.asyncio
+async def test_reminder_batch_continues_after_failed_shift(monkeypatch, engine, db, tenant):
+    """Schlägt der Versand für einen Dienst fehl, bekommen die übrigen trotzdem ihre Erinnerung."""
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr("app.core.database.TaskSessionLocal", session_factory)
+
+    emp = Employee(
+        tenant_id=tenant.id,
+        first_name="Nina",
+        last_name="Test",
+        email="nina@test.de",
+        contract_type="minijob",
+        hourly_rate=13.0,
+        vacation_days=0,
+        is_active=True,
+        notification_prefs={"events": {"shift_reminder": True}},
+    )
+    db.add(emp)
+    await db.commit()
+
+    tomorrow = date.today() + timedelta(days=1)
+    failing = Shift(tenant_id=tenant.id, employee_id=emp.id, date=tomorrow,
+                    start_time=time(8, 0), end_time=time(12, 0))
+    later = Shift(tenant_id=tenant.id, employee_id=emp.id, date=tomorrow,
+                  start_time=time(14, 0), end_time=time(18, 0))
+    db.add_all([failing, later])
+    await db.commit()
+
+    real_dispatch = reminder_tasks._dispatch_reminder
+
+    async def flaky_dispatch(task_db, shift, hours_before, shift_type_name):
+        if shift.id == failing.id:
+            raise RuntimeError("SMTP down")
+        await real_dispatch(task_db, shift, hours_before, shift_type_name)
+
+    monkeypatch.setattr(reminder_tasks, "_dispatch_reminder", flaky_dispatch)
+
+    await _do_send_reminders_batch([str(failing.id), str(later.id)], hours_before=24)
+
+    log_result = await db.execute(select(NotificationLog).where(NotificationLog.event_type == "shift_reminder"))
+    logs = log_result.scalars().all()
+    assert len(logs) == 1
+    assert "14:00" in (logs[0].subject or "")
@@ -8,7 +8,7 @@ from datetime import date, time
 
 import pytest
 
-from app.services.recurring_shift_service import build_skip_set, preview_generate
+from app.services.recurring_shift_service import SkipDates, preview_generate
 from app.utils.german_holidays import get_bw_holidays
 
 
@@ -31,70 +31,80 @@ class _Profile:
         self.custom_holidays = custom_days or []
 
 
-# ── build_skip_set ────────────────────────────────────────────────────────────
-
-def test_build_skip_set_no_profile_no_holidays():
-    """Without profile and skip_public=False the skip set is empty."""
-    result = build_skip_set(profile=None, skip_public_holidays=False, years={2025})
-    assert result == set()
-
-
-def test_build_skip_set_vacation_period():
-    """All dates within a VacationPeriod appear in the skip set."""
-    profile = _Profile(periods=[_Period(date(2025, 10, 27), date(2025, 10, 31))])
-    skip = build_skip_set(profile, skip_public_holidays=False, years={2025})
-    assert date(2025, 10, 27) in skip
-    assert date(2025, 10, 31) in skip
-    assert date(2025, 11, 1) not in skip
-
-
-def test_build_skip_set_vacation_period_boundaries_inclusive():
-    """start_date and end_date are both included."""
-    profile = _Profile(periods=[_Period(date(2026, 1, 5), date(2026, 1, 5))])
-    skip = build_skip_set(profile, skip_public_holidays=False, years={2026})
-    assert date(2026, 1, 5) in skip
-    assert date(2026, 1, 4) not in skip
-    assert date(2026, 1, 6) not in skip
-
-
-def test_build_skip_set_custom_holiday():
-    """A CustomHoliday date is included in the skip set."""
-    profile = _Profile(custom_days=[_CustomDay(date(2025, 11, 3))])
-    skip = build_skip_set(profile, skip_public_holidays=False, years={2025})
-    assert date(2025, 11, 3) in skip
-    assert date(2025, 11, 4) not in skip
-
-
-def test_build_skip_set_public_holidays_bw():
-    """Known BW public holidays are in the skip set when skip_public=True."""
-    skip = build_skip_set(profile=None, skip_public_holidays=True, years={2025})
-    # Neujahr
-    assert date(2025, 1, 1) in skip
-    # Tag der Arbeit
-    assert date(2025, 5, 1) in skip
-    # 1. Weihnachtstag
-    assert date(2025, 12, 25) in skip
-    # Allerheiligen (BW-spezifisch)
-    assert date(2025, 11, 1) in skip
-
-
-def test_build_skip_set_combines_all_sources():
-    """VacationPeriod + CustomHoliday + public holidays are all merged."""
+# ── SkipDates ─────────────────────────────────────────────────────────────────
+
+_VACATION_OCT = _Period(date(2025, 10, 27), date(2025, 10, 31))
+
+
+@pytest.mark.parametrize("profile, skip_public, years, expected_in, expected_out", [
+    # Without profile and skip_public=False nothing is skipped
+    pytest.param(
+        None, False, {2025},
+        set(), {date(2025, 1, 1), date(2025, 12, 25)},
+        id="nothing_to_skip",
+    ),
+    # All dates within a VacationPeriod appear in the skip set
+    pytest.param(
+        _Profile(periods=[_VACATION_OCT]), False, {2025},
+        {date(2025, 10, 27), date(2025, 10, 31)}, {date(2025, 11, 1)},
+        id="vacation_period",
+    ),
+    # start_date and end_date are both included
+    pytest.param(
+        _Profile(periods=[_Period(date(2026, 1, 5), date(2026, 1, 5))]), False, {2026},
+        {date(2026, 1, 5)}, {date(2026, 1, 4), date(2026, 1, 6)},
+        id="vacation_period_boundaries_inclusive",
+    ),
+    # A CustomHoliday date is included in the skip set
+    pytest.param(
+        _Profile(custom_days=[_CustomDay(date(2025, 11, 3))]), False, {2025},
+        {date(2025, 11, 3)}, {date(2025, 11, 4)},
+        id="custom_holiday",
+    ),
+    # Known BW public holidays: Neujahr, Tag der Arbeit, 1. Weihnachtstag, Allerheiligen (BW-spezifisch)
+    pytest.param(
+        None, True, {2025},
+        {date(2025, 1, 1), date(2025, 5, 1), date(2025, 12, 25), date(2025, 11, 1)}, set(),
+        id="public_holidays_bw",
+    ),
+    # VacationPeriod + CustomHoliday + public holidays are all merged
+    pytest.param(
+        _Profile(periods=[_VACATION_OCT], custom_days=[_CustomDay(date(2025, 11, 3))]), True, {2025},
+        {date(2025, 10, 28), date(2025, 11, 3), date(2025, 11, 1)}, set(),
+        id="combines_all_sources",
+    ),
+    # When years spans two calendar years, both are included
+    pytest.param(
+        None, True, {2025, 2026},
+        {date(2025, 1, 1), date(2026, 1, 1)}, set(),
+        id="multi_year",
+    ),
+])
+def test_skip_dates(profile, skip_public, years, expected_in, expected_out):
+    skip = SkipDates(profile, skip_public_holidays=skip_public, years=years)
+    assert all(d in skip for d in expected_in)
+    assert not any(d in skip for d in expected_out)
+
+
+def test_skip_dates_overlapping_periods():
+    """Overlapping/adjacent periods are merged; every day in their union is skipped, nothing else."""
     profile = _Profile(
-        periods=[_Period(date(2025, 10, 27), date(2025, 10, 31))],
-        custom_days=[_CustomDay(date(2025, 11, 3))],
+        periods=[
+            _Period(date(2025, 10, 27), date(2025, 10, 31)),
+            _Period(date(2025, 10, 30), date(2025, 11, 4)),   # overlapping
+            _Period(date(2025, 11, 5), date(2025, 11, 6)),    # adjacent
+            _Period(date(2025, 12, 22), date(2026, 1, 5)),
+        ],
     )
-    skip = build_skip_set(profile, skip_public_holidays=True, years={2025})
-    assert date(2025, 10, 28) in skip   # vacation period
-    assert date(2025, 11, 3) in skip    # custom holiday
-    assert date(2025, 11, 1) in skip    # Allerheiligen (public)
+    skip = SkipDates(profile, skip_public_holidays=False, years={2025, 2026})
 
+    expected = {date.fromordinal(o) for o in range(date(2025, 10, 27).toordinal(), date(2025, 11, 7).toordinal())}
+    expected |= {date.fromordinal(o) for o in range(date(2025, 12, 22).toordinal(), date(2026, 1, 6).toordinal())}
 
-def test_build_skip_set_multi_year():
-    """When years spans two calendar years, both are included."""
-    skip = build_skip_set(profile=None, skip_public_holidays=True, years={2025, 2026})
-    assert date(2025, 1, 1) in skip
-    assert date(2026, 1, 1) in skip
+    d = date(2025, 10, 1)
+    while d <= date(2026, 1, 31):
+        assert (d in skip) == (d in expected), d
+        d = d.fromordinal(d.toordinal() + 1)
 
 
 # ── preview_generate ──────────────────────────────────────────────────────────
@@ -128,6 +138,21 @@ async def test_preview_counts_mondays_in_month():
     assert result["skipped_count"] == 0
 
 
+@pytest.mark.asyncio
+async def test_preview_range_starting_mid_week():
+    """from_date after the weekday → first match is in the following week."""
+    result = await preview_generate(
+        weekday=0,
+        from_date=date(2025, 9, 3),   # Wednesday
+        until_date=date(2025, 9, 29),  # Monday (inclusive)
+        profile=None,
+        skip_public_holidays=False,
+    )
+    # Mondays: 8, 15, 22, 29 → 4
+    assert result["generated_count"] == 4
+    assert result["skipped_count"] == 0
+
+
 @pytest.mark.asyncio
 async def test_preview_skips_vacation_period():
     """Mondays inside a vacation period are counted as skipped."""
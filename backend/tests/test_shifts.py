@@ -48,9 +48,22 @@ async def test_create_shift_admin(client, admin_token, admin_user, tenant):
     assert "id" in data
 
 
+@pytest.mark.parametrize("verb, url, payload", [
+    ("post", SHIFTS_URL, SHIFT_PAYLOAD),
+    ("put", SHIFTS_URL + "/{id}", {"status": "confirmed"}),
+    ("delete", SHIFTS_URL + "/{id}", None),
+], ids=["create", "update", "delete"])
 @pytest.mark.asyncio
-async def test_create_shift_employee_forbidden(client, employee_token, employee_user, tenant):
-    resp = await client.post(SHIFTS_URL, json=SHIFT_PAYLOAD, headers=auth_headers(employee_token))
+async def test_shift_write_employee_forbidden(client, admin_token, employee_token,
+                                              admin_user, employee_user, tenant, verb, url, payload):
+    """Employee-Rolle darf Schichten weder anlegen noch ändern oder löschen."""
+    if "{id}" in url:
+        # Existierende Schicht, damit 403 nicht mit 404 verwechselt wird
+        create = await client.post(SHIFTS_URL, json=SHIFT_PAYLOAD, headers=auth_headers(admin_token))
+        url = url.format(id=create.json()["id"])
+
+    kwargs = {"json": payload} if payload is not None else {}
+    resp = await getattr(client, verb)(url, headers=auth_headers(employee_token), **kwargs)
     assert resp.status_code == 403
 
 
@@ -121,20 +134,6 @@ async def test_update_shift_status_to_confirmed(client, admin_token, admin_user,
     assert resp.json()["status"] == "confirmed"
 
 
-@pytest.mark.asyncio
-async def test_update_shift_employee_forbidden(client, admin_token, employee_token,
-                                                admin_user, employee_user, tenant):
-    create = await client.post(SHIFTS_URL, json=SHIFT_PAYLOAD, headers=auth_headers(admin_token))
-    shift_id = create.json()["id"]
-
-    resp = await client.put(
-        f"{SHIFTS_URL}/{shift_id}",
-        json={"status": "confirmed"},
-        headers=auth_headers(employee_token),
-    )
-    assert resp.status_code == 403
-
-
 @pytest.mark.asyncio
 async def test_admin_can_edit_confirmed_shift_times(client, admin_token, admin_user, tenant):
     """Admin darf Zeiten eines bereits bestätigten Dienstes korrigieren."""
@@ -185,16 +184,6 @@ async def test_delete_shift_admin(client, admin_token, admin_user, tenant):
     assert resp.status_code == 204
 
 
-@pytest.mark.asyncio
-async def test_delete_shift_employee_forbidden(client, admin_token, employee_token,
-                                                admin_user, employee_user, tenant):
-    create = await client.post(SHIFTS_URL, json=SHIFT_PAYLOAD, headers=auth_headers(admin_token))
-    shift_id = create.json()["id"]
-
-    resp = await client.delete(f"{SHIFTS_URL}/{shift_id}", headers=auth_headers(employee_token))
-    assert resp.status_code == 403
-
-
 # ── POST /shifts/bulk ─────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio